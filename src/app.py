@@ -1,7 +1,7 @@
 """Main application window."""
 
 import logging
-from typing import Optional
+from typing import Callable, List, Optional, Set
 from pathlib import Path
 
 from PyQt6.QtWidgets import (
@@ -11,16 +11,36 @@ from PyQt6.QtWidgets import (
     QSplitter,
     QMessageBox,
 )
-from PyQt6.QtCore import Qt, QSize
+from PyQt6.QtCore import Qt, QSize, QTimer
 from PyQt6.QtGui import QKeySequence, QShortcut, QAction
 
-from .core import Note, StorageManager, AutoSaveManager
+from .core import (
+    Note,
+    NoteHeader,
+    StorageManager,
+    SQLiteStorageManager,
+    AutoSaveManager,
+    NoteWriterThread,
+    HeaderLoader,
+)
 from .ui import RichTextEditor, NotesList, get_stylesheet
 from .ui.animations import animation_manager
-from .helpers import create_welcome_note
 
 logger = logging.getLogger(__name__)
 
+# Use the single-file SQLite backend; set to False to keep per-note JSON files
+USE_SQLITE_STORAGE = True
+
+# Number of note headers loaded for the sidebar at startup
+NOTES_PAGE_SIZE = 50
+
+# Failed background saves are retried after this delay, doubled with every
+# further failure up to the maximum
+SAVE_RETRY_DELAY_MS = 1000
+SAVE_RETRY_MAX_DELAY_MS = 60_000
+# Failed saves in a row before the user is warned
+SAVE_FAILURES_BEFORE_WARNING = 3
+
 
 class MainWindow(QMainWindow):
     """Main application window with glassmorphism UI.
@@ -36,15 +56,43 @@ class MainWindow(QMainWindow):
     def __init__(self):
         """Initialize main window."""
         super().__init__()
-        self.storage = StorageManager()
+        storage_class = (
+            SQLiteStorageManager if USE_SQLITE_STORAGE else StorageManager
+        )
+        self.storage = storage_class()
+        # Auto-saves are written on a background thread with its own storage
+        self._writer = NoteWriterThread(
+            lambda: storage_class(self.storage.storage_dir)
+        )
+        self._writer.start()
+        # Further pages of headers and searches are read on a background thread
+        self._header_loader = HeaderLoader(
+            lambda: storage_class(self.storage.storage_dir), self
+        )
         self.current_note: Optional[Note] = None
-        self._auto_save_manager: Optional[AutoSaveManager] = None
+        # One auto-save manager serves every note; pending saves are keyed
+        # by note id, so switching notes needs no new timer
+        self._auto_save_manager = AutoSaveManager(
+            save_callback=self._save_notes,
+            delay_ms=1000
+        )
+        # Bound trigger, looked up once rather than on every keystroke
+        self._trigger_auto_save: Callable[[Note], None] = (
+            self._auto_save_manager.trigger
+        )
+        # Ids of notes whose failed save is retried when the timer fires
+        self._retry_ids: Set[str] = set()
+        self._failed_saves = 0  # Failed background saves in a row
+        self._retry_timer = QTimer(self)
+        self._retry_timer.setSingleShot(True)
+        self._retry_timer.timeout.connect(self._retry_failed_saves)
         self._is_closing = False  # Flag for smooth close animation
 
         self._setup_window()
         self._setup_ui()
         self._setup_shortcuts()
-        self._load_notes()
+        # Load once the event loop runs, so the window shows without waiting
+        QTimer.singleShot(0, self._load_notes)
 
         logger.info("Main window initialized")
 
@@ -94,8 +142,15 @@ class MainWindow(QMainWindow):
         self._notes_list.note_selected.connect(self._on_note_selected)
         self._notes_list.new_note_requested.connect(self._create_new_note)
         self._notes_list.delete_note_requested.connect(self._delete_note)
+        self._notes_list.load_more_requested.connect(self._load_more_notes)
+        self._notes_list.search_requested.connect(self._header_loader.search)
+        self._header_loader.headers_loaded.connect(self._on_headers_loaded)
+        self._header_loader.search_finished.connect(self._on_search_finished)
+        self._writer.notes_saved.connect(self._on_notes_saved)
+        self._writer.save_failed.connect(self._on_save_failed)
 
-        # Don't connect editor content_changed yet (will connect after loading)
+        # Connected once; edits are ignored until a note has been opened
+        self._editor.content_changed.connect(self._on_editor_changed)
 
     def _setup_shortcuts(self) -> None:
         """Set up keyboard shortcuts."""
@@ -124,59 +179,121 @@ class MainWindow(QMainWindow):
         logger.info("Keyboard shortcuts configured")
 
     def _load_notes(self) -> None:
-        """Load all notes from storage."""
-        notes = self.storage.load_all_notes()
+        """Load the first page of note headers from storage.
 
-        if not notes:
-            # Create welcome note if no notes exist
-            self._create_welcome_note()
-            notes = self.storage.load_all_notes()
+        Only headers are read here; a note's content is loaded when it
+        is opened.
+        """
+        headers = self.storage.load_note_headers(limit=NOTES_PAGE_SIZE)
+
+        if not headers:
+            # Create welcome note if no notes exist; it is already in
+            # memory, so there is nothing to read back from storage
+            welcome_note = self._create_welcome_note()
+            headers = [welcome_note.to_header()]
+            self._notes_list.set_notes(headers)
+            self._notes_list.select_note(welcome_note.id)
+            self._open_note(welcome_note)
+            logger.info("Loaded welcome note")
+            return
 
-        self._notes_list.set_notes(notes)
+        self._notes_list.set_notes(headers, self.storage.get_note_count())
 
         # Select first note
-        if notes:
-            self._notes_list.select_note(notes[0].id)
-            self._on_note_selected(notes[0])
+        self._notes_list.select_note(headers[0].id)
+        self._on_note_selected(headers[0].id)
+
+        logger.info(f"Loaded {len(headers)} note headers")
+
+    def _load_more_notes(self, offset: int, limit: int) -> None:
+        """Request a further page of note headers for the sidebar.
 
-        logger.info(f"Loaded {len(notes)} notes")
+        The page is read in the background and appended by
+        ``_on_headers_loaded``.
+
+        Args:
+            offset: Number of headers already loaded
+            limit: Number of headers to load (negative for all remaining)
+        """
+        self._header_loader.request(offset, limit if limit >= 0 else None)
+
+    def _on_headers_loaded(self, headers: List[NoteHeader]) -> None:
+        """Append a page of headers loaded in the background.
+
+        Args:
+            headers: Loaded note headers
+        """
+        if self._is_closing:
+            return
+        self._notes_list.append_notes(headers)
+        logger.debug(f"Loaded {len(headers)} more note headers")
+
+    def _on_search_finished(self, query: str, note_ids: List[str]) -> None:
+        """Show the notes matching a search run in the background.
+
+        Args:
+            query: Casefolded query that was searched for
+            note_ids: IDs of the matching notes
+        """
+        if self._is_closing:
+            return
+        self._notes_list.show_search_results(query, note_ids)
+
+    def _create_welcome_note(self) -> Note:
+        """Create and save a welcome note for first-time users.
+
+        Returns:
+            The welcome note
+        """
+        # Only needed on first run, so not imported at startup
+        from .helpers import create_welcome_note
 
-    def _create_welcome_note(self) -> None:
-        """Create a welcome note for first-time users."""
         welcome_note = create_welcome_note()
         self.storage.save_note(welcome_note)
         logger.info("Created welcome note")
+        return welcome_note
 
-    def _on_note_selected(self, note: Note) -> None:
-        """Handle note selection.
+    def _on_note_selected(self, note_id: str) -> None:
+        """Handle note selection by loading the note's content.
 
         Args:
-            note: Selected note
+            note_id: ID of the selected note
         """
-        # Save current note before switching
-        if self.current_note and self._auto_save_manager:
+        if self.current_note is not None:
+            if note_id == self.current_note.id:
+                # Already open; reloading would drop edits not yet saved
+                return
+            # Queue the current note's latest edits before reading the target
+            self._editor.flush_changes()
             self._auto_save_manager.save_now()
 
-        # Disconnect auto-save temporarily
-        if self._auto_save_manager:
-            self._editor.content_changed.disconnect(
-                self._auto_save_manager.trigger
-            )
+        # A queued save may not have reached storage yet
+        note = self._writer.pending_note(note_id)
+        if note is None:
+            note = self.storage.load_note(note_id)
+        if note is None:
+            logger.error(f"Failed to open note: {note_id}")
+            return
 
-        # Load new note
+        self._open_note(note)
+
+    def _open_note(self, note: Note) -> None:
+        """Show a note in the editor.
+
+        Args:
+            note: Note to open
+        """
+        # Save current note before switching
+        if self.current_note:
+            self._editor.flush_changes()
+            self._auto_save_manager.save_now()
+
+        # Load new note; it matches storage (or a queued save) as loaded
+        note.mark_saved()
         self.current_note = note
         self._editor.set_html(note.content)
         self._editor.set_modified(False)
 
-        # Set up auto-save for new note
-        self._auto_save_manager = AutoSaveManager(
-            save_callback=self._save_current_note,
-            delay_ms=1000
-        )
-        self._editor.content_changed.connect(
-            self._auto_save_manager.trigger
-        )
-
         logger.info(f"Loaded note: {note.id}")
 
     def _create_new_note(self) -> None:
@@ -188,11 +305,11 @@ class MainWindow(QMainWindow):
         # Save to storage
         if self.storage.save_note(note):
             # Add to list
-            self._notes_list.add_note(note)
+            self._notes_list.add_note(note.to_header())
 
             # Select the new note
             self._notes_list.select_note(note.id)
-            self._on_note_selected(note)
+            self._open_note(note)
 
             # Focus editor
             self._editor.set_focus()
@@ -206,29 +323,121 @@ class MainWindow(QMainWindow):
                 "Failed to create new note. Please try again."
             )
 
+    def _on_editor_changed(self) -> None:
+        """Queue the current note for auto-save after an edit."""
+        if self.current_note is not None:
+            self._trigger_auto_save(self.current_note)
+
     def _save_current_note(self) -> None:
-        """Save the current note."""
+        """Save the current note immediately."""
         if not self.current_note:
             return
 
-        # Update note content
-        content = self._editor.get_html()
-        self.current_note.update_content(content)
+        self._auto_save_manager.trigger(self.current_note)
+        self._auto_save_manager.save_now()
+        self._writer.flush_sync()
+
+    def _save_notes(self, notes: List[Note]) -> None:
+        """Queue a batch of pending notes for the background writer.
+
+        The writer saves the batch in one storage transaction off the UI
+        thread; the notes list is updated right away from memory. Notes
+        whose content is unchanged since they were last saved are skipped.
+
+        Args:
+            notes: Notes queued by the auto-save manager
+        """
+        includes_current = self.current_note is not None and any(
+            note.id == self.current_note.id for note in notes
+        )
+        if includes_current:
+            # Pull the latest editor content into the current note
+            content = self._editor.get_html()
+            if content != self.current_note.content:
+                self.current_note.update_content(content)
+
+        notes = [note for note in notes if note.has_unsaved_changes()]
+        if notes:
+            self._writer.enqueue(notes)
 
-        # Save to storage
-        if self.storage.save_note(self.current_note):
             # Update in list
-            self._notes_list.update_note(self.current_note)
+            for note in notes:
+                note.mark_saved()
+                self._notes_list.update_note(note.to_header())
+        if includes_current:
             self._editor.set_modified(False)
-            logger.debug(f"Saved note: {self.current_note.id}")
-        else:
-            logger.error(f"Failed to save note: {self.current_note.id}")
+        logger.debug(f"Queued {len(notes)} notes for saving")
+
+    def _on_notes_saved(self, note_ids: List[str]) -> None:
+        """Reset the failure count once the background writer saves again.
+
+        Args:
+            note_ids: IDs of the saved notes
+        """
+        if self._failed_saves:
+            logger.info("Saving notes works again")
+            self._failed_saves = 0
+
+    def _on_save_failed(self, notes: List[Note]) -> None:
+        """Schedule a retry of notes the background writer failed to save.
+
+        Retries back off exponentially while saves keep failing, and the
+        user is warned once per run of failures.
+
+        Args:
+            notes: Snapshots of the notes whose write failed
+        """
+        if self._is_closing:
+            return
+        if self.current_note is not None:
+            for note in notes:
+                if note.id == self.current_note.id:
+                    self.current_note.mark_unsaved()
+        self._retry_ids.update(note.id for note in notes)
+
+        self._failed_saves += 1
+        delay_ms = min(
+            SAVE_RETRY_DELAY_MS * 2 ** (self._failed_saves - 1),
+            SAVE_RETRY_MAX_DELAY_MS,
+        )
+        self._retry_timer.start(delay_ms)
+        logger.warning(
+            f"Failed to save {len(notes)} notes; retrying in {delay_ms}ms"
+        )
+
+        if self._failed_saves == SAVE_FAILURES_BEFORE_WARNING:
+            QMessageBox.warning(
+                self,
+                "Error",
+                "Notes could not be saved. Saving will be retried; "
+                "check that there is free disk space and that the notes "
+                "folder is writable."
+            )
+
+    def _retry_failed_saves(self) -> None:
+        """Queue the notes whose save failed for writing again."""
+        current = self.current_note
+        notes = []
+        for note_id in self._retry_ids:
+            if current is not None and note_id == current.id:
+                # The open note includes edits made since the failed save
+                notes.append(current)
+                continue
+            # The writer keeps failed snapshots until they are saved or
+            # discarded, so a missing one belongs to a deleted note
+            note = self._writer.pending_note(note_id)
+            if note is not None:
+                notes.append(note)
+        self._retry_ids.clear()
+
+        if notes:
+            self._save_notes(notes)
 
     def _delete_selected_note(self) -> None:
         """Delete the currently selected note."""
-        selected_note = self._notes_list.get_selected_note()
-        if selected_note:
-            self._delete_note(selected_note.id)
+        selected_id = self._notes_list.get_selected_note_id()
+        if selected_id:
+            self._delete_note(selected_id)
 
     def _delete_note(self, note_id: str) -> None:
         """Delete a note.
@@ -245,7 +454,13 @@ class MainWindow(QMainWindow):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
+            # Let queued saves land first so they cannot re-create the note
+            self._writer.flush_sync()
             if self.storage.delete_note(note_id):
+                # Drop unsaved copies, which would otherwise write it back
+                self._auto_save_manager.discard(note_id)
+                self._writer.discard(note_id)
+                self._retry_ids.discard(note_id)
                 self._notes_list.remove_note(note_id)
 
                 # Clear editor if current note was deleted
@@ -278,12 +493,21 @@ class MainWindow(QMainWindow):
         self._is_closing = True
 
         # Save current note before closing
-        if self.current_note and self._auto_save_manager:
+        if self.current_note:
+            self._editor.flush_changes()
             self._auto_save_manager.save_now()
 
+        # Give notes whose save failed one last attempt
+        self._retry_timer.stop()
+        self._retry_failed_saves()
+
         # Clean up auto-save manager
-        if self._auto_save_manager:
-            self._auto_save_manager.cleanup()
+        self._auto_save_manager.cleanup()
+
+        # Write everything still queued before closing storage
+        self._header_loader.close()
+        self._writer.stop()
+        self.storage.close()
 
         logger.info("Application closing")
 
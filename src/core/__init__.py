@@ -1,7 +1,18 @@
 """Core data models and business logic."""
 
-from .note import Note
+from .note import Note, NoteHeader
 from .storage import StorageManager
+from .storage_sqlite import SQLiteStorageManager
 from .auto_save import AutoSaveManager
+from .writer_thread import NoteWriterThread
+from .header_loader import HeaderLoader
 
-__all__ = ["Note", "StorageManager", "AutoSaveManager"]
+__all__ = [
+    "Note",
+    "NoteHeader",
+    "StorageManager",
+    "SQLiteStorageManager",
+    "AutoSaveManager",
+    "NoteWriterThread",
+    "HeaderLoader",
+]
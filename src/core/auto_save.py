@@ -1,37 +1,48 @@
 """Auto-save manager with debouncing."""
 
 import logging
-from typing import Callable, Optional
+import time
+from typing import Callable, Dict, List, Optional
 
 from PyQt6.QtCore import QTimer
 
+from .note import Note
+
 logger = logging.getLogger(__name__)
 
+# Triggers closer together than this do not restart the debounce timer
+_RESTART_INTERVAL_MS = 50
+
 
 class AutoSaveManager:
     """Manages automatic saving with debouncing.
 
     Delays save operations until user stops typing, preventing
-    excessive disk writes while ensuring data is never lost.
+    excessive disk writes while ensuring data is never lost. Notes
+    triggered during the delay are collected by id and handed to the
+    save callback together, so a burst of edits is saved as one batch.
 
     Attributes:
-        save_callback: Function to call when saving
+        save_callback: Function to call with the batch of notes to save
         delay_ms: Delay in milliseconds before saving
     """
 
     def __init__(
         self,
-        save_callback: Callable[[], None],
+        save_callback: Callable[[List[Note]], None],
         delay_ms: int = 1000
     ):
         """Initialize auto-save manager.
 
         Args:
-            save_callback: Function to call when saving (takes no args)
+            save_callback: Function to call when saving (takes the list
+                of pending notes)
             delay_ms: Delay in milliseconds before saving (default: 1000ms)
         """
         self.save_callback = save_callback
         self.delay_ms = delay_ms
+        self._pending: Dict[str, Note] = {}
+        self._last_restart_ms = 0
 
         # Create debounce timer
         self._timer = QTimer()
@@ -41,30 +52,55 @@ class AutoSaveManager:
         self._is_enabled = True
         logger.info(f"Auto-save initialized with {delay_ms}ms delay")
 
-    def trigger(self) -> None:
-        """Trigger auto-save (restarts debounce timer).
+    def trigger(self, note: Note) -> None:
+        """Mark a note dirty and trigger auto-save (restarts debounce timer).
 
         Call this method whenever content changes. The actual save
         will happen after the delay period with no new triggers.
+
+        Args:
+            note: Note whose content changed
         """
         if not self._is_enabled:
             return
 
+        self._pending[note.id] = note
+
+        # A timer restarted moments ago is already due to fire; skipping
+        # the restart saves a Qt call per keystroke while typing fast
+        now_ms = time.monotonic_ns() // 1_000_000
+        if (now_ms - self._last_restart_ms < _RESTART_INTERVAL_MS
+                and self._timer.isActive()):
+            return
+
         # Restart the timer (debounce)
-        self._timer.stop()
         self._timer.start(self.delay_ms)
+        self._last_restart_ms = now_ms
         logger.debug("Auto-save triggered")
 
     def _on_save(self) -> None:
-        """Internal: Execute save callback."""
+        """Internal: Execute save callback for all pending notes."""
+        if not self._pending:
+            return
+
+        notes = list(self._pending.values())
+        self._pending.clear()
         try:
-            logger.debug("Executing auto-save")
-            self.save_callback()
+            logger.debug(f"Executing auto-save for {len(notes)} notes")
+            self.save_callback(notes)
         except Exception as e:
             logger.error(f"Auto-save failed: {e}")
 
+    def discard(self, note_id: str) -> None:
+        """Drop a note's pending save, e.g. after the note was deleted.
+
+        Args:
+            note_id: ID of the note
+        """
+        self._pending.pop(note_id, None)
+
     def save_now(self) -> None:
-        """Force immediate save, bypassing debounce timer."""
+        """Force immediate save of pending notes, bypassing debounce timer."""
         self._timer.stop()
         self._on_save()
 
@@ -77,6 +113,7 @@ class AutoSaveManager:
         """Disable auto-save and cancel pending saves."""
         self._is_enabled = False
         self._timer.stop()
+        self._pending.clear()
         logger.info("Auto-save disabled")
 
     def set_delay(self, delay_ms: int) -> None:
@@ -0,0 +1,129 @@
+"""Background loading of note header pages and searches."""
+
+import logging
+from typing import Callable, Optional
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+logger = logging.getLogger(__name__)
+
+
+class _LoaderTask(QRunnable):
+    """Pool task running one read of a HeaderLoader."""
+
+    def __init__(self, read: Callable[..., None], *args):
+        super().__init__()
+        self._read = read
+        self._args = args
+
+    def run(self) -> None:
+        """Run the read on the loader thread."""
+        self._read(*self._args)
+
+
+class HeaderLoader(QObject):
+    """Loads pages of note headers and runs searches on a background thread.
+
+    Reading headers for older JSON notes requires parsing the note HTML,
+    and a search reads every note's plain text. Requests made here run off
+    the UI thread and their results are delivered through signals, which
+    Qt queues back to the thread the loader lives on. Requests run one at
+    a time, in order, on a single pool thread that creates its storage
+    manager on the first request and reuses it, so the SQLite backend
+    opens one connection for the loader rather than one per request.
+
+    Signals:
+        headers_loaded: Emitted with the list of loaded headers
+        search_finished: Emitted with a query and the ids of the matching
+            notes
+
+    Attributes:
+        storage_factory: Callable creating the storage manager used for reads
+    """
+
+    headers_loaded = pyqtSignal(list)
+    search_finished = pyqtSignal(str, list)
+
+    def __init__(self, storage_factory: Callable[[], object],
+                 parent: Optional[QObject] = None):
+        """Initialize header loader.
+
+        Args:
+            storage_factory: Callable returning a storage manager; called
+                once, on the loader thread
+            parent: Parent object
+        """
+        super().__init__(parent)
+        self.storage_factory = storage_factory
+        self._storage = None
+        # Latest query passed to search(); older queued searches are skipped
+        self._query: Optional[str] = None
+        # One long-lived thread: requests run in order on one connection
+        self._pool = QThreadPool(self)
+        self._pool.setMaxThreadCount(1)
+        self._pool.setExpiryTimeout(-1)
+
+    def request(self, offset: int, limit: Optional[int] = None) -> None:
+        """Queue a page of headers to be loaded.
+
+        Args:
+            offset: Number of headers to skip
+            limit: Maximum number of headers to load (None for all)
+        """
+        self._pool.start(_LoaderTask(self._load, offset, limit))
+
+    def search(self, query: str) -> None:
+        """Queue a search of every note's title and plain text.
+
+        Args:
+            query: Casefolded search query
+        """
+        self._query = query
+        self._pool.start(_LoaderTask(self._search, query))
+
+    def wait(self) -> None:
+        """Block until every queued request has finished."""
+        self._pool.waitForDone()
+
+    def close(self) -> None:
+        """Wait for queued requests, then close the loader's storage."""
+        self.wait()
+        if self._storage is not None:
+            self._storage.close()
+            self._storage = None
+
+    def _reader(self):
+        """Get the loader's storage manager, creating it on first use."""
+        if self._storage is None:
+            self._storage = self.storage_factory()
+        return self._storage
+
+    def _load(self, offset: int, limit: Optional[int]) -> None:
+        """Load a page and emit it (runs on the loader thread).
+
+        Args:
+            offset: Number of headers to skip
+            limit: Maximum number of headers to load (None for all)
+        """
+        try:
+            headers = self._reader().load_note_headers(offset, limit)
+        except Exception as e:
+            logger.error(f"Failed to load note headers: {e}")
+            headers = []
+        self.headers_loaded.emit(headers)
+
+    def _search(self, query: str) -> None:
+        """Search the notes and emit the matches (runs on the loader thread).
+
+        Args:
+            query: Casefolded search query
+        """
+        if query != self._query:
+            # A newer search is queued behind this one
+            return
+        try:
+            note_ids = self._reader().search_notes(query)
+        except Exception as e:
+            logger.error(f"Failed to search notes: {e}")
+            note_ids = []
+        self.search_finished.emit(query, note_ids)
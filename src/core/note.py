@@ -2,14 +2,125 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Optional
-import uuid
+from functools import lru_cache
+from typing import NamedTuple, Optional
+import html
+import re
+import secrets
 
+# Only the start of the content is scanned when extracting the title
+_TITLE_SCAN_LIMIT = 4096
 
-@dataclass
+_HIDDEN_RE = re.compile(
+    r"<(head|style|script|title)\b.*?</\1\s*>|<!--.*?-->",
+    re.IGNORECASE | re.DOTALL,
+)
+_BLOCK_RE = re.compile(
+    r"<(?:br|hr|/?(?:p|div|h[1-6]|li|ul|ol|table|tr|blockquote|pre))\b[^>]*>",
+    re.IGNORECASE,
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_NEWLINE_RE = re.compile(r"\s*[\r\n]\s*")
+
+# Recent HTML -> plain text conversions kept by html_to_plain_text
+_PLAIN_TEXT_CACHE_SIZE = 16
+
+# Characters of plain text a note header carries for the list preview
+_PREVIEW_LENGTH = 200
+
+
+@lru_cache(maxsize=_PLAIN_TEXT_CACHE_SIZE)
+def html_to_plain_text(markup: str) -> str:
+    """Convert HTML to plain text without building a QTextDocument.
+
+    Line breaks in the markup itself count as spaces, block-level tags
+    become line breaks, all other tags are dropped and entities are
+    unescaped. Empty lines are removed.
+
+    Results are cached: one save converts the same content for the notes
+    list and again for storage, and the cache is shared across threads.
+
+    Args:
+        markup: HTML content
+
+    Returns:
+        Plain text, one line per non-empty block
+    """
+    if not markup:
+        return ""
+
+    if "<" not in markup and "&" not in markup:
+        # No tags or entities: only whitespace needs normalizing
+        return _NEWLINE_RE.sub(" ", markup).replace("\xa0", " ").strip()
+
+    text = _HIDDEN_RE.sub("", markup)
+    text = _NEWLINE_RE.sub(" ", text)
+    text = _BLOCK_RE.sub("\n", text)
+    text = html.unescape(_TAG_RE.sub("", text)).replace("\xa0", " ")
+    return "\n".join(
+        line for line in (part.strip() for part in text.split("\n")) if line
+    )
+
+
+def plain_text_preview(plain_text: str) -> str:
+    """Cut plain text down to the preview stored in a note header.
+
+    Args:
+        plain_text: Plain text of a note
+
+    Returns:
+        The start of the plain text
+    """
+    return plain_text[:_PREVIEW_LENGTH]
+
+
+def _new_note_id() -> str:
+    """Generate a 64-bit random note id as 16 hex characters.
+
+    Existing UUID ids are kept as they are; any string is a valid id.
+    """
+    return secrets.token_hex(8)
+
+
+def _parse_datetime(value) -> datetime:
+    """Accept a datetime or an ISO-8601 string and return a datetime."""
+    if isinstance(value, datetime):
+        return value
+    return datetime.fromisoformat(value)
+
+
+class NoteHeader(NamedTuple):
+    """Lightweight view of a note used by the notes list.
+
+    Carries everything the sidebar needs without the HTML content, which
+    is only loaded when a note is opened. Only the start of the plain text
+    is included, so a header stays small however long the note is; search
+    runs against the full text in storage.
+
+    Attributes:
+        id: Unique identifier for the note
+        title: Note title
+        modified_at: Timestamp when note was last modified
+        is_favorite: Whether note is marked as favorite
+        preview: Start of the plain text, for the list preview
+    """
+
+    id: str
+    title: str
+    modified_at: datetime
+    is_favorite: bool
+    preview: str
+
+
+@dataclass(slots=True)
 class Note:
     """Represents a single note with metadata.
 
+    Instances use ``__slots__`` rather than a per-object ``__dict__``.
+    The notes list holds ``NoteHeader`` tuples, whose preview is capped,
+    so a sidebar entry stays the same size however long its note is; full
+    notes are only kept for the note being edited and the pending saves.
+
     Attributes:
         id: Unique identifier for the note
         title: Note title (derived from first line of content)
@@ -19,22 +130,85 @@ class Note:
         is_favorite: Whether note is marked as favorite
     """
 
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = field(default_factory=_new_note_id)
     title: str = "Untitled"
     content: str = ""
     created_at: datetime = field(default_factory=datetime.now)
     modified_at: datetime = field(default_factory=datetime.now)
     is_favorite: bool = False
+    # Hash of the scanned content prefix the current title was taken from
+    _title_cache_key: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Hash of the content as last handed to storage
+    _saved_hash: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Plain text of the content and the hash of the content it came from
+    _plain_text: str = field(default="", init=False, repr=False, compare=False)
+    _plain_text_key: Optional[int] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def plain_text(self) -> str:
+        """Plain text of the content, converted once per content change.
+
+        Returns:
+            Plain text, one line per non-empty block
+        """
+        key = hash(self.content)
+        if key != self._plain_text_key:
+            self._plain_text = html_to_plain_text(self.content)
+            self._plain_text_key = key
+        return self._plain_text
+
+    def set_plain_text(self, plain_text: str) -> None:
+        """Record plain text known to match the current content.
+
+        Storage keeps the plain text next to the content, so a loaded note
+        does not have to convert its HTML again until the content changes.
+
+        Args:
+            plain_text: Plain text of the current content
+        """
+        self._plain_text = plain_text
+        self._plain_text_key = hash(self.content)
 
     def update_content(self, content: str) -> None:
         """Update note content and refresh metadata.
 
+        The title is only re-extracted when the start of the content,
+        which is all the title is taken from, has changed.
+
         Args:
             content: New content for the note (HTML format)
         """
         self.content = content
         self.modified_at = datetime.now()
-        self.title = self._extract_title(content)
+
+        title_key = hash(content[:_TITLE_SCAN_LIMIT])
+        if title_key != self._title_cache_key:
+            self.title = self._extract_title(content)
+            self._title_cache_key = title_key
+
+    def mark_saved(self) -> None:
+        """Record the current content as the copy held by storage."""
+        self._saved_hash = hash(self.content)
+
+    def mark_unsaved(self) -> None:
+        """Forget the saved copy, e.g. after a write to storage failed."""
+        self._saved_hash = None
+
+    def has_unsaved_changes(self) -> bool:
+        """Check whether the content differs from the copy in storage.
+
+        Returns:
+            True unless the content matches the last ``mark_saved`` call
+        """
+        if self._saved_hash is None:
+            return True
+        return hash(self.content) != self._saved_hash
 
     def _extract_title(self, content: str) -> str:
         """Extract title from content (first line, plain text).
@@ -48,11 +222,15 @@ class Note:
         if not content or not content.strip():
             return "Untitled"
 
-        # Use QTextDocument to properly convert HTML to plain text
-        from PyQt6.QtGui import QTextDocument
-        doc = QTextDocument()
-        doc.setHtml(content)
-        plain_text = doc.toPlainText().strip()
+        # Only the first line matters, so skip converting the whole document
+        snippet = content[:_TITLE_SCAN_LIMIT]
+        if len(content) > _TITLE_SCAN_LIMIT:
+            # Drop a tag cut in half by the slice
+            cut = snippet.rfind("<")
+            if cut > snippet.rfind(">"):
+                snippet = snippet[:cut]
+
+        plain_text = html_to_plain_text(snippet)
 
         if not plain_text:
             return "Untitled"
@@ -66,19 +244,40 @@ class Note:
 
         return title or "Untitled"
 
+    def to_header(self) -> NoteHeader:
+        """Build the lightweight header for this note.
+
+        Returns:
+            NoteHeader for the notes list
+        """
+        return NoteHeader(
+            id=self.id,
+            title=self.title,
+            modified_at=self.modified_at,
+            is_favorite=self.is_favorite,
+            preview=plain_text_preview(self.plain_text),
+        )
+
     def to_dict(self) -> dict:
         """Convert note to dictionary for serialization.
 
+        Header fields come first, then the full plain text and ``content``
+        last, so readers that only need the header can stop before the
+        plain text and search can stop before the HTML body. Timestamps
+        are left as datetime objects for the serializer to encode.
+
         Returns:
             Dictionary representation of the note
         """
         return {
             "id": self.id,
             "title": self.title,
-            "content": self.content,
-            "created_at": self.created_at.isoformat(),
-            "modified_at": self.modified_at.isoformat(),
+            "created_at": self.created_at,
+            "modified_at": self.modified_at,
             "is_favorite": self.is_favorite,
+            "preview": plain_text_preview(self.plain_text),
+            "plain_text": self.plain_text,
+            "content": self.content,
         }
 
     @classmethod
@@ -86,18 +285,22 @@ class Note:
         """Create note from dictionary.
 
         Args:
-            data: Dictionary containing note data
+            data: Dictionary containing note data (timestamps may be
+                ISO-8601 strings or datetime objects)
 
         Returns:
             Note instance
         """
-        return cls(
-            id=data.get("id", str(uuid.uuid4())),
+        note = cls(
+            id=data.get("id") or _new_note_id(),
             title=data.get("title", "Untitled"),
             content=data.get("content", ""),
-            created_at=datetime.fromisoformat(data["created_at"])
+            created_at=_parse_datetime(data["created_at"])
                 if "created_at" in data else datetime.now(),
-            modified_at=datetime.fromisoformat(data["modified_at"])
+            modified_at=_parse_datetime(data["modified_at"])
                 if "modified_at" in data else datetime.now(),
             is_favorite=data.get("is_favorite", False),
         )
+        if "plain_text" in data:
+            note.set_plain_text(data["plain_text"])
+        return note
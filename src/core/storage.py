@@ -1,14 +1,119 @@
 """Storage manager for persisting notes to disk."""
 
+import hashlib
+import heapq
 import json
 import logging
+import os
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, FrozenSet, List, Optional
 
-from .note import Note
+from .note import Note, NoteHeader, html_to_plain_text, plain_text_preview
 
 logger = logging.getLogger(__name__)
 
+# Header fields are written before "plain_text" and the plain text before
+# "content", so header reads stop at the first key and searches at the second
+_PLAIN_TEXT_KEY = b'"plain_text":'
+_CONTENT_KEY = b'"content":'
+_HEADER_CHUNK_SIZE = 1024
+# Fields each read needs before it can skip the rest of the file
+_HEADER_FIELDS = frozenset(("id", "modified_at", "preview"))
+_SEARCH_FIELDS = frozenset(("id", "plain_text"))
+
+# Below this many files, load_all_notes decodes them on the calling thread
+_PARALLEL_LOAD_THRESHOLD = 16
+_MAX_LOAD_WORKERS = 8
+
+# Number of recently saved notes remembered for skipping unchanged saves
+_SAVED_DIGEST_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=None)
+def _orjson():
+    """Import orjson on first use, as only the JSON backend needs it.
+
+    Returns:
+        The orjson module, or None if it is not installed
+    """
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def _dumps(data: dict) -> bytes:
+    """Serialize a note dictionary to compact JSON bytes."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_APPEND_NEWLINE)
+    text = json.dumps(data, ensure_ascii=False, default=datetime.isoformat)
+    return (text + "\n").encode("utf-8")
+
+
+def _mtime(entry: os.DirEntry) -> float:
+    """Sort key: modification time of a scanned note file."""
+    return entry.stat().st_mtime
+
+
+def _loads(raw: bytes) -> dict:
+    """Parse JSON bytes into a dictionary."""
+    orjson = _orjson()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _scan_fields(f: BinaryIO, stop_key: bytes,
+                 fields: FrozenSet[str]) -> dict:
+    """Read chunks until a key and parse only the fields before it.
+
+    Args:
+        f: Note file opened in binary mode
+        stop_key: Quoted key, with its colon, to stop reading at
+        fields: Fields that have to come before ``stop_key``
+
+    Returns:
+        Fields before ``stop_key``; every field if one of ``fields`` is
+        missing there
+    """
+    prefix = bytearray()
+    stop_pos = -1
+    while True:
+        chunk = f.read(_HEADER_CHUNK_SIZE)
+        # Only search the new bytes, plus enough to catch a split key
+        start = max(0, len(prefix) - len(stop_key))
+        prefix += chunk
+        stop_pos = prefix.find(stop_key, start)
+        if stop_pos != -1 or not chunk:
+            break
+
+    if stop_pos != -1:
+        head = bytes(prefix[:stop_pos]).rstrip().rstrip(b',')
+        data = _loads(head + b'}')
+        if fields.issubset(data):
+            return data
+    return _loads(bytes(prefix) + f.read())
+
+
+def _plain_text_of(data: dict) -> str:
+    """Get the plain text of a parsed note, converting its HTML if needed.
+
+    Args:
+        data: Note fields, including ``content`` if ``plain_text`` is missing
+
+    Returns:
+        Plain text of the note
+    """
+    if "plain_text" in data:
+        return data["plain_text"]
+    return html_to_plain_text(data.get("content", ""))
+
 
 class StorageManager:
     """Manages note persistence using JSON files.
@@ -30,6 +135,8 @@ class StorageManager:
             storage_dir = Path.cwd() / "notes"
 
         self.storage_dir = Path(storage_dir)
+        # note id -> digest of the last saved content, least recent first
+        self._saved_digests: "OrderedDict[str, tuple]" = OrderedDict()
         self._ensure_storage_dir()
 
     def _ensure_storage_dir(self) -> None:
@@ -44,6 +151,10 @@ class StorageManager:
     def save_note(self, note: Note) -> bool:
         """Save a note to disk.
 
+        The file is written to a temporary sibling and moved into place,
+        so readers never see a half-written note. Saves are skipped when
+        the content is unchanged since this manager last saved the note.
+
         Args:
             note: Note to save
 
@@ -52,14 +163,42 @@ class StorageManager:
         """
         try:
             file_path = self.storage_dir / f"{note.id}.json"
-            with open(file_path, 'w', encoding='utf-8') as f:
-                json.dump(note.to_dict(), f, indent=2, ensure_ascii=False)
+            digest = (
+                hashlib.sha1(note.content.encode("utf-8")).digest(),
+                note.is_favorite,
+            )
+            if (self._saved_digests.get(note.id) == digest
+                    and file_path.exists()):
+                self._saved_digests.move_to_end(note.id)
+                logger.debug(f"Note {note.id} unchanged, skipped save")
+                return True
+
+            tmp_path = file_path.with_suffix(".json.tmp")
+            tmp_path.write_bytes(_dumps(note.to_dict()))
+            os.replace(tmp_path, file_path)
+
+            self._saved_digests[note.id] = digest
+            self._saved_digests.move_to_end(note.id)
+            if len(self._saved_digests) > _SAVED_DIGEST_CACHE_SIZE:
+                self._saved_digests.popitem(last=False)
             logger.debug(f"Saved note {note.id}")
             return True
         except Exception as e:
             logger.error(f"Failed to save note {note.id}: {e}")
             return False
 
+    def save_notes_bulk(self, notes: List[Note]) -> bool:
+        """Save several notes to disk.
+
+        Args:
+            notes: Notes to save
+
+        Returns:
+            True if every note was saved, False otherwise
+        """
+        results = [self.save_note(note) for note in notes]
+        return all(results)
+
     def load_note(self, note_id: str) -> Optional[Note]:
         """Load a note from disk.
 
@@ -75,39 +214,172 @@ class StorageManager:
                 logger.warning(f"Note {note_id} not found")
                 return None
 
-            with open(file_path, 'r', encoding='utf-8') as f:
-                data = json.load(f)
-            return Note.from_dict(data)
+            return Note.from_dict(_loads(file_path.read_bytes()))
         except Exception as e:
             logger.error(f"Failed to load note {note_id}: {e}")
             return None
 
+    def _scan_note_files(self) -> List[os.DirEntry]:
+        """List the note files in the storage directory.
+
+        Returns:
+            Directory entries of the note files, in no particular order
+        """
+        with os.scandir(self.storage_dir) as entries:
+            return [
+                entry for entry in entries
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+
+    def _newest_note_files(
+        self, count: Optional[int] = None
+    ) -> List[os.DirEntry]:
+        """Get note files ordered by file modification time, newest first.
+
+        Every save rewrites the file, so its mtime tracks ``modified_at``
+        without opening it.
+
+        Args:
+            count: Number of files needed (None for all)
+
+        Returns:
+            Directory entries, newest first
+        """
+        entries = self._scan_note_files()
+        if count is None:
+            return sorted(entries, key=_mtime, reverse=True)
+        return heapq.nlargest(count, entries, key=_mtime)
+
     def load_all_notes(self) -> List[Note]:
         """Load all notes from disk.
 
+        Files are read and decoded on a small thread pool once there are
+        enough of them to make up for the pool's overhead.
+
         Returns:
-            List of all notes, sorted by modification time (newest first)
+            List of all notes, sorted by file modification time (newest first)
         """
-        notes = []
         try:
-            for file_path in self.storage_dir.glob("*.json"):
-                try:
-                    with open(file_path, 'r', encoding='utf-8') as f:
-                        data = json.load(f)
-                    note = Note.from_dict(data)
-                    notes.append(note)
-                except Exception as e:
-                    logger.error(f"Failed to load note from {file_path}: {e}")
-                    continue
+            entries = self._newest_note_files()
+            if len(entries) < _PARALLEL_LOAD_THRESHOLD:
+                loaded = [self._load_file(entry) for entry in entries]
+            else:
+                workers = min(_MAX_LOAD_WORKERS, os.cpu_count() or 1)
+                with ThreadPoolExecutor(max_workers=workers) as executor:
+                    loaded = list(executor.map(self._load_file, entries))
 
-            # Sort by modification time, newest first
-            notes.sort(key=lambda n: n.modified_at, reverse=True)
+            notes = [note for note in loaded if note is not None]
             logger.info(f"Loaded {len(notes)} notes")
             return notes
         except Exception as e:
             logger.error(f"Failed to load notes: {e}")
             return []
 
+    def _load_file(self, entry: os.DirEntry) -> Optional[Note]:
+        """Load one note file.
+
+        Args:
+            entry: Directory entry of the note file
+
+        Returns:
+            Note instance or None if the file could not be loaded
+        """
+        try:
+            with open(entry.path, 'rb') as f:
+                return Note.from_dict(_loads(f.read()))
+        except Exception as e:
+            logger.error(f"Failed to load note from {entry.path}: {e}")
+            return None
+
+    def load_note_headers(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> List[NoteHeader]:
+        """Load note headers without parsing the HTML content.
+
+        Files are ordered by their modification time, so only the files
+        on the requested page are opened.
+
+        Args:
+            offset: Number of headers to skip
+            limit: Maximum number of headers to return (None for all)
+
+        Returns:
+            Note headers, sorted by file modification time (newest first)
+        """
+        headers = []
+        try:
+            count = None if limit is None else offset + limit
+            entries = list(self._newest_note_files(count))[offset:]
+            for entry in entries:
+                try:
+                    headers.append(self._read_header(Path(entry.path)))
+                except Exception as e:
+                    logger.error(f"Failed to load header from {entry.path}: {e}")
+                    continue
+
+            return headers
+        except Exception as e:
+            logger.error(f"Failed to load note headers: {e}")
+            return []
+
+    def _read_header(self, file_path: Path) -> NoteHeader:
+        """Read a note header from the start of a JSON file.
+
+        The file is read in small chunks until the ``plain_text`` key and
+        only the fields before it are parsed, so neither the full plain
+        text nor the HTML body is read. Files written without a preview
+        are parsed in full.
+
+        Args:
+            file_path: Path to the note's JSON file
+
+        Returns:
+            Header for the note
+        """
+        with open(file_path, 'rb') as f:
+            data = _scan_fields(f, _PLAIN_TEXT_KEY, _HEADER_FIELDS)
+
+        if "preview" not in data:
+            data["preview"] = plain_text_preview(_plain_text_of(data))
+
+        return NoteHeader(
+            id=data["id"],
+            title=data.get("title", "Untitled"),
+            modified_at=datetime.fromisoformat(data["modified_at"])
+                if "modified_at" in data else datetime.now(),
+            is_favorite=data.get("is_favorite", False),
+            preview=data["preview"],
+        )
+
+    def search_notes(self, query: str) -> List[str]:
+        """Find the notes whose title or plain text contains a query.
+
+        Each file is read up to its ``content`` key; files written without
+        a plain text are parsed in full.
+
+        Args:
+            query: Casefolded search query
+
+        Returns:
+            IDs of the matching notes, in no particular order
+        """
+        note_ids = []
+        try:
+            for entry in self._scan_note_files():
+                try:
+                    with open(entry.path, 'rb') as f:
+                        data = _scan_fields(f, _CONTENT_KEY, _SEARCH_FIELDS)
+                except Exception as e:
+                    logger.error(f"Failed to search {entry.path}: {e}")
+                    continue
+                if (query in data.get("title", "").casefold()
+                        or query in _plain_text_of(data).casefold()):
+                    note_ids.append(data["id"])
+            return note_ids
+        except Exception as e:
+            logger.error(f"Failed to search notes: {e}")
+            return []
+
     def delete_note(self, note_id: str) -> bool:
         """Delete a note from disk.
 
@@ -118,6 +390,7 @@ class StorageManager:
             True if deletion was successful, False otherwise
         """
         try:
+            self._saved_digests.pop(note_id, None)
             file_path = self.storage_dir / f"{note_id}.json"
             if file_path.exists():
                 file_path.unlink()
@@ -137,7 +410,10 @@ class StorageManager:
             Number of notes in storage
         """
         try:
-            return len(list(self.storage_dir.glob("*.json")))
+            return len(self._scan_note_files())
         except Exception as e:
             logger.error(f"Failed to count notes: {e}")
             return 0
+
+    def close(self) -> None:
+        """Release storage resources (nothing to release for JSON files)."""
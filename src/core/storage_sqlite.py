@@ -0,0 +1,707 @@
+"""SQLite storage manager for persisting notes to a single database."""
+
+import logging
+import secrets
+import sqlite3
+import threading
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+
+from .note import Note, NoteHeader, plain_text_preview
+from .storage import StorageManager
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
+# Tuned for a single-writer desktop app: WAL turns each save into an
+# append instead of a full rewrite, and NORMAL sync is durable in WAL mode.
+_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=10737418240",
+    "PRAGMA busy_timeout=3000",
+)
+
+_SCHEMA = (
+    """
+    CREATE TABLE IF NOT EXISTS notes (
+        id TEXT PRIMARY KEY,
+        title TEXT NOT NULL,
+        content TEXT NOT NULL,
+        created_at TEXT NOT NULL,
+        modified_at TEXT NOT NULL,
+        is_favorite INTEGER NOT NULL DEFAULT 0,
+        plain_text TEXT NOT NULL DEFAULT '',
+        preview TEXT NOT NULL DEFAULT '',
+        revision INTEGER NOT NULL DEFAULT 0
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS idx_modified ON notes(modified_at DESC)",
+    """
+    CREATE TABLE IF NOT EXISTS note_ops (
+        note_id TEXT NOT NULL,
+        seq INTEGER NOT NULL,
+        field INTEGER NOT NULL,
+        start INTEGER NOT NULL,
+        removed INTEGER NOT NULL,
+        inserted TEXT NOT NULL,
+        PRIMARY KEY (note_id, seq)
+    )
+    """,
+)
+
+# Content shorter than this (in bytes) is stored as plain text
+_COMPRESS_MIN_SIZE = 512
+_ZSTD_LEVEL = 3
+
+# ``PRAGMA user_version`` once legacy JSON notes have been imported
+_IMPORTED_VERSION = 1
+
+# Edits logged for a note before its row is rewritten in full
+_MAX_OPS_PER_NOTE = 64
+
+# Values of ``note_ops.field``: the column a logged splice applies to
+_CONTENT_FIELD = 0
+_PLAIN_TEXT_FIELD = 1
+
+_COLUMNS = "id, title, content, created_at, modified_at, is_favorite"
+_HEADER_COLUMNS = "id, title, modified_at, is_favorite, preview"
+_NOTE_COLUMNS = f"{_COLUMNS}, plain_text"
+
+_UPSERT_SQL = (
+    f"INSERT OR REPLACE INTO notes ({_COLUMNS}, plain_text, preview, "
+    "revision) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)"
+)
+
+
+# Only matches a row nobody else has written since this manager did
+_UPDATE_HEADER_SQL = (
+    "UPDATE notes SET title = ?, modified_at = ?, is_favorite = ?, "
+    "preview = ?, revision = ? WHERE id = ? AND revision = ?"
+)
+_INSERT_OP_SQL = (
+    "INSERT INTO note_ops (note_id, seq, field, start, removed, inserted) "
+    "VALUES (?, ?, ?, ?, ?, ?)"
+)
+_DELETE_OPS_SQL = "DELETE FROM note_ops WHERE note_id = ?"
+_SELECT_OPS_SQL = (
+    "SELECT field, start, removed, inserted FROM note_ops "
+    "WHERE note_id = ? ORDER BY seq"
+)
+# Notes whose plain_text column is only current once their log is replayed
+_LOGGED_PLAIN_TEXT_IDS_SQL = (
+    f"SELECT note_id FROM note_ops WHERE field = {_PLAIN_TEXT_FIELD}"
+)
+_SEARCH_SQL = (
+    f"SELECT id FROM notes WHERE id NOT IN ({_LOGGED_PLAIN_TEXT_IDS_SQL}) "
+    "AND (contains_folded(title, ?) OR contains_folded(plain_text, ?))"
+)
+_SELECT_LOGGED_PLAIN_TEXT_SQL = (
+    "SELECT id, title, plain_text FROM notes "
+    f"WHERE id IN ({_LOGGED_PLAIN_TEXT_IDS_SQL})"
+)
+_SELECT_PLAIN_TEXT_OPS_SQL = (
+    "SELECT note_id, start, removed, inserted FROM note_ops "
+    f"WHERE field = {_PLAIN_TEXT_FIELD} ORDER BY note_id, seq"
+)
+
+
+class _LogState(NamedTuple):
+    """What a manager last wrote for a note, for logging the next edit.
+
+    Attributes:
+        content: Content the row plus its op log currently rebuilds
+        plain_text: Plain text the row plus its op log currently rebuilds
+        op_count: Number of ops logged since the row was written in full
+        revision: Revision token the row was left with
+    """
+
+    content: str
+    plain_text: str
+    op_count: int
+    revision: int
+
+
+def _new_revision() -> int:
+    """Generate a random token identifying one write of a row."""
+    return secrets.randbits(62)
+
+
+def _common_prefix_length(a: str, b: str) -> int:
+    """Length of the common prefix of two strings.
+
+    Binary search over slice comparisons keeps the character loop in C.
+    """
+    low, high = 0, min(len(a), len(b))
+    while low < high:
+        mid = (low + high + 1) // 2
+        if a[:mid] == b[:mid]:
+            low = mid
+        else:
+            high = mid - 1
+    return low
+
+
+def _diff(old: str, new: str) -> Tuple[int, int, str]:
+    """Describe the change from ``old`` to ``new`` as a single splice.
+
+    Returns:
+        ``(start, removed, inserted)``: ``removed`` characters at ``start``
+        are replaced by ``inserted``
+    """
+    prefix = _common_prefix_length(old, new)
+    suffix = _common_prefix_length(old[prefix:][::-1], new[prefix:][::-1])
+    return prefix, len(old) - prefix - suffix, new[prefix:len(new) - suffix]
+
+
+# zstandard codecs are not thread-safe, so each thread gets its own
+_zstd_codecs = threading.local()
+
+
+def _compress_content(content: str):
+    """Encode content for the ``content`` column.
+
+    Larger content is stored as a zstd-compressed BLOB when zstandard is
+    installed; everything else stays TEXT.
+
+    Returns:
+        The content string or compressed bytes
+    """
+    if not ZSTD_AVAILABLE:
+        return content
+    data = content.encode("utf-8")
+    if len(data) < _COMPRESS_MIN_SIZE:
+        return content
+    compressor = getattr(_zstd_codecs, "compressor", None)
+    if compressor is None:
+        compressor = zstandard.ZstdCompressor(level=_ZSTD_LEVEL)
+        _zstd_codecs.compressor = compressor
+    return compressor.compress(data)
+
+
+def _decompress_content(value) -> str:
+    """Decode a ``content`` column value written by ``_compress_content``."""
+    if isinstance(value, str):
+        return value
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("zstandard is required to read compressed notes")
+    decompressor = getattr(_zstd_codecs, "decompressor", None)
+    if decompressor is None:
+        decompressor = zstandard.ZstdDecompressor()
+        _zstd_codecs.decompressor = decompressor
+    return decompressor.decompress(value).decode("utf-8")
+
+
+def _apply_ops(content: str, ops: List[tuple]) -> str:
+    """Replay logged splices, oldest first, onto a content snapshot."""
+    for start, removed, inserted in ops:
+        content = content[:start] + inserted + content[start + removed:]
+    return content
+
+
+def _contains_folded(text: str, query: str) -> bool:
+    """SQL function ``contains_folded``: casefolded substring test."""
+    return query in text.casefold()
+
+
+def _note_to_row(note: Note, revision: int) -> tuple:
+    """Convert a note to a row tuple matching ``_UPSERT_SQL``."""
+    return (
+        note.id,
+        note.title,
+        _compress_content(note.content),
+        note.created_at.isoformat(),
+        note.modified_at.isoformat(),
+        int(note.is_favorite),
+        note.plain_text,
+        plain_text_preview(note.plain_text),
+        revision,
+    )
+
+
+def _row_to_note(cursor: sqlite3.Cursor, row: tuple) -> Note:
+    """Row factory building a note from a row matching ``_NOTE_COLUMNS``."""
+    note = Note(
+        id=row[0],
+        title=row[1],
+        content=_decompress_content(row[2]),
+        created_at=datetime.fromisoformat(row[3]),
+        modified_at=datetime.fromisoformat(row[4]),
+        is_favorite=bool(row[5]),
+    )
+    note.set_plain_text(row[6])
+    return note
+
+
+def _patch_note(note: Note, ops: List[tuple]) -> None:
+    """Apply logged edits to a note loaded from its row.
+
+    Args:
+        note: Note built from the row (plain text seeded from the row)
+        ops: The note's ``(field, start, removed, inserted)`` ops
+    """
+    plain_text = _apply_ops(
+        note.plain_text,
+        [op[1:] for op in ops if op[0] == _PLAIN_TEXT_FIELD],
+    )
+    note.content = _apply_ops(
+        note.content, [op[1:] for op in ops if op[0] == _CONTENT_FIELD]
+    )
+    note.set_plain_text(plain_text)
+
+
+def _row_to_header(cursor: sqlite3.Cursor, row: tuple) -> NoteHeader:
+    """Row factory building a header from a row matching ``_HEADER_COLUMNS``."""
+    return NoteHeader(
+        id=row[0],
+        title=row[1],
+        modified_at=datetime.fromisoformat(row[2]),
+        is_favorite=bool(row[3]),
+        preview=row[4],
+    )
+
+
+class SQLiteStorageManager:
+    """Manages note persistence using a single SQLite database.
+
+    All notes live in one ``notes.db`` file inside the storage directory.
+    The connection is opened once and kept for the lifetime of the manager.
+    Existing per-note JSON files are imported once; the database records
+    when the import has succeeded.
+
+    Once a note has been written in full, later saves from the same
+    manager only update its header columns and append the edited spans of
+    the content and plain text to the ``note_ops`` log; the row is
+    rewritten after ``_MAX_OPS_PER_NOTE`` ops. Loads replay the log on
+    top of the stored row. Every write sets a new ``revision`` token; if
+    another manager wrote the row in between, the token no longer matches
+    and the note is written in full instead of logged against a stale base.
+
+    Attributes:
+        storage_dir: Directory where the database is stored
+        db_path: Path to the SQLite database file
+    """
+
+    DB_FILENAME = "notes.db"
+
+    def __init__(self, storage_dir: Optional[Path] = None):
+        """Initialize storage manager.
+
+        Args:
+            storage_dir: Directory to store notes. Defaults to ./notes
+        """
+        if storage_dir is None:
+            storage_dir = Path.cwd() / "notes"
+
+        self.storage_dir = Path(storage_dir)
+        self.db_path = self.storage_dir / self.DB_FILENAME
+        # note id -> what this manager last wrote for it
+        self._logged: Dict[str, _LogState] = {}
+        self._ensure_storage_dir()
+        self._conn = self._connect()
+
+        if self._conn.execute("PRAGMA user_version").fetchone()[0] == 0:
+            self._migrate_json_notes()
+
+    def _ensure_storage_dir(self) -> None:
+        """Ensure storage directory exists."""
+        try:
+            self.storage_dir.mkdir(parents=True, exist_ok=True)
+            logger.info(f"Storage directory initialized at {self.storage_dir}")
+        except Exception as e:
+            logger.error(f"Failed to create storage directory: {e}")
+            raise
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database and apply pragmas and schema.
+
+        Returns:
+            Configured SQLite connection
+        """
+        conn = sqlite3.connect(
+            self.db_path,
+            isolation_level=None,
+            check_same_thread=False,
+        )
+        for pragma in _PRAGMAS:
+            conn.execute(pragma)
+        conn.create_function(
+            "contains_folded", 2, _contains_folded, deterministic=True
+        )
+        for statement in _SCHEMA:
+            conn.execute(statement)
+        logger.info(f"SQLite database opened at {self.db_path}")
+        return conn
+
+    @contextmanager
+    def _snapshot(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed reads against one consistent database state.
+
+        A row and its op log are read separately; a read transaction keeps
+        another connection's write from landing between the two.
+        """
+        self._conn.execute("BEGIN")
+        try:
+            yield self._conn
+        finally:
+            self._conn.execute("COMMIT")
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Run the enclosed statements in one write transaction."""
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield self._conn
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        else:
+            self._conn.execute("COMMIT")
+
+    def _migrate_json_notes(self) -> None:
+        """Import legacy per-note JSON files into the database once.
+
+        All notes are inserted in one transaction, which also sets
+        ``PRAGMA user_version`` to record that the import is done; if it
+        fails, it is retried on the next start. Notes already in the
+        database are left alone.
+        """
+        legacy_notes = []
+        if any(self.storage_dir.glob("*.json")):
+            legacy_notes = StorageManager(self.storage_dir).load_all_notes()
+
+        try:
+            with self._transaction() as conn:
+                existing = {
+                    row[0] for row in conn.execute("SELECT id FROM notes")
+                }
+                legacy_notes = [
+                    note for note in legacy_notes if note.id not in existing
+                ]
+                logged = self._write_notes(conn, legacy_notes)
+                conn.execute(f"PRAGMA user_version = {_IMPORTED_VERSION}")
+        except Exception as e:
+            logger.error(f"Failed to migrate notes from JSON files: {e}")
+            return
+
+        self._logged.update(logged)
+        if legacy_notes:
+            logger.info(f"Migrated {len(legacy_notes)} notes from JSON files")
+
+    def save_note(self, note: Note) -> bool:
+        """Save a note to the database.
+
+        Args:
+            note: Note to save
+
+        Returns:
+            True if save was successful, False otherwise
+        """
+        try:
+            with self._transaction() as conn:
+                logged = self._write_notes(conn, [note])
+            self._logged.update(logged)
+            logger.debug(f"Saved note {note.id}")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save note {note.id}: {e}")
+            return False
+
+    def save_notes_bulk(self, notes: List[Note]) -> bool:
+        """Save several notes in a single transaction.
+
+        Args:
+            notes: Notes to save
+
+        Returns:
+            True if save was successful, False otherwise
+        """
+        try:
+            with self._transaction() as conn:
+                logged = self._write_notes(conn, notes)
+            self._logged.update(logged)
+            logger.debug(f"Saved {len(notes)} notes")
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save {len(notes)} notes: {e}")
+            return False
+
+    def _write_notes(
+        self, conn: sqlite3.Connection, notes: List[Note]
+    ) -> Dict[str, _LogState]:
+        """Write notes inside an open transaction.
+
+        Notes this manager has written before get their header columns
+        updated and their edits appended to the op log, provided the row
+        still has the revision this manager left it with. Other notes, and
+        notes whose log is full, are written in full and have their log
+        cleared.
+
+        Args:
+            conn: Connection with an open write transaction
+            notes: Notes to write
+
+        Returns:
+            Op log state to record once the transaction has committed
+        """
+        full_rows = []
+        op_rows = []
+        logged: Dict[str, _LogState] = {}
+
+        for note in notes:
+            revision = _new_revision()
+            state = self._logged.get(note.id)
+            if state is not None and state.op_count < _MAX_OPS_PER_NOTE:
+                cursor = conn.execute(_UPDATE_HEADER_SQL, (
+                    note.title,
+                    note.modified_at.isoformat(),
+                    int(note.is_favorite),
+                    plain_text_preview(note.plain_text),
+                    revision,
+                    note.id,
+                    state.revision,
+                ))
+                if cursor.rowcount == 1:
+                    op_count = state.op_count
+                    for field, base, value in (
+                        (_CONTENT_FIELD, state.content, note.content),
+                        (_PLAIN_TEXT_FIELD, state.plain_text, note.plain_text),
+                    ):
+                        if value != base:
+                            op_rows.append(
+                                (note.id, op_count, field) + _diff(base, value)
+                            )
+                            op_count += 1
+                    logged[note.id] = _LogState(
+                        note.content, note.plain_text, op_count, revision
+                    )
+                    continue
+                logger.debug(
+                    f"Note {note.id} was written elsewhere; writing in full"
+                )
+
+            full_rows.append(_note_to_row(note, revision))
+            logged[note.id] = _LogState(
+                note.content, note.plain_text, 0, revision
+            )
+
+        if full_rows:
+            conn.executemany(
+                _DELETE_OPS_SQL, [(row[0],) for row in full_rows]
+            )
+            conn.executemany(_UPSERT_SQL, full_rows)
+        if op_rows:
+            conn.executemany(_INSERT_OP_SQL, op_rows)
+        return logged
+
+    def _load_ops(
+        self, note_id: Optional[str] = None
+    ) -> Dict[str, List[tuple]]:
+        """Read logged edits, oldest first.
+
+        Args:
+            note_id: Note to read the log for (None for all notes)
+
+        Returns:
+            Mapping of note id to its ``(field, start, removed, inserted)``
+            ops
+        """
+        if note_id is not None:
+            rows = self._conn.execute(_SELECT_OPS_SQL, (note_id,)).fetchall()
+            return {note_id: rows} if rows else {}
+
+        ops: Dict[str, List[tuple]] = {}
+        for row in self._conn.execute(
+            "SELECT note_id, field, start, removed, inserted FROM note_ops "
+            "ORDER BY note_id, seq"
+        ):
+            ops.setdefault(row[0], []).append(row[1:])
+        return ops
+
+    def _select(
+        self,
+        row_factory: Callable[[sqlite3.Cursor, tuple], object],
+        sql: str,
+        params: tuple = (),
+    ) -> sqlite3.Cursor:
+        """Run a query on a cursor that builds result objects directly.
+
+        The factory is set on the cursor rather than the connection, so
+        other queries keep returning plain tuples.
+
+        Args:
+            row_factory: Called with the cursor and each row tuple
+            sql: Query to run
+            params: Query parameters
+
+        Returns:
+            Cursor yielding the factory's objects
+        """
+        cursor = self._conn.cursor()
+        cursor.row_factory = row_factory
+        return cursor.execute(sql, params)
+
+    def load_note(self, note_id: str) -> Optional[Note]:
+        """Load a note from the database.
+
+        Args:
+            note_id: ID of the note to load
+
+        Returns:
+            Note instance or None if not found/error
+        """
+        try:
+            with self._snapshot():
+                note = self._select(
+                    _row_to_note,
+                    f"SELECT {_NOTE_COLUMNS} FROM notes WHERE id = ?",
+                    (note_id,),
+                ).fetchone()
+                ops = self._load_ops(note_id) if note is not None else {}
+            if note is None:
+                logger.warning(f"Note {note_id} not found")
+                return None
+            if ops:
+                _patch_note(note, ops[note_id])
+            return note
+        except Exception as e:
+            logger.error(f"Failed to load note {note_id}: {e}")
+            return None
+
+    def load_all_notes(self) -> List[Note]:
+        """Load all notes from the database.
+
+        Returns:
+            List of all notes, sorted by modification time (newest first)
+        """
+        try:
+            with self._snapshot():
+                notes = self._select(
+                    _row_to_note,
+                    f"SELECT {_NOTE_COLUMNS} FROM notes "
+                    "ORDER BY modified_at DESC",
+                ).fetchall()
+                ops = self._load_ops()
+            if ops:
+                for note in notes:
+                    if note.id in ops:
+                        _patch_note(note, ops[note.id])
+            logger.info(f"Loaded {len(notes)} notes")
+            return notes
+        except Exception as e:
+            logger.error(f"Failed to load notes: {e}")
+            return []
+
+    def load_note_headers(
+        self, offset: int = 0, limit: Optional[int] = None
+    ) -> List[NoteHeader]:
+        """Load one page of note headers without the HTML content.
+
+        The ``preview`` column is rewritten with every save, logged or
+        not, so headers are read without replaying the op log.
+
+        Args:
+            offset: Number of headers to skip
+            limit: Maximum number of headers to return (None for all)
+
+        Returns:
+            Note headers, sorted by modification time (newest first)
+        """
+        try:
+            return self._select(
+                _row_to_header,
+                f"SELECT {_HEADER_COLUMNS} FROM notes "
+                "ORDER BY modified_at DESC LIMIT ? OFFSET ?",
+                (-1 if limit is None else limit, offset),
+            ).fetchall()
+        except Exception as e:
+            logger.error(f"Failed to load note headers: {e}")
+            return []
+
+    def search_notes(self, query: str) -> List[str]:
+        """Find the notes whose title or plain text contains a query.
+
+        Rows are matched inside SQLite; only notes with logged plain-text
+        edits are rebuilt and matched here.
+
+        Args:
+            query: Casefolded search query
+
+        Returns:
+            IDs of the matching notes, in no particular order
+        """
+        try:
+            with self._snapshot() as conn:
+                note_ids = [
+                    row[0] for row in conn.execute(_SEARCH_SQL, (query, query))
+                ]
+                logged = conn.execute(_SELECT_LOGGED_PLAIN_TEXT_SQL).fetchall()
+                ops: Dict[str, List[tuple]] = {}
+                if logged:
+                    for row in conn.execute(_SELECT_PLAIN_TEXT_OPS_SQL):
+                        ops.setdefault(row[0], []).append(row[1:])
+            for note_id, title, plain_text in logged:
+                plain_text = _apply_ops(plain_text, ops[note_id])
+                if _contains_folded(title, query) or _contains_folded(
+                    plain_text, query
+                ):
+                    note_ids.append(note_id)
+            return note_ids
+        except Exception as e:
+            logger.error(f"Failed to search notes: {e}")
+            return []
+
+    def delete_note(self, note_id: str) -> bool:
+        """Delete a note from the database.
+
+        Args:
+            note_id: ID of the note to delete
+
+        Returns:
+            True if deletion was successful, False otherwise
+        """
+        try:
+            self._logged.pop(note_id, None)
+            with self._transaction() as conn:
+                conn.execute(_DELETE_OPS_SQL, (note_id,))
+                cursor = conn.execute(
+                    "DELETE FROM notes WHERE id = ?", (note_id,)
+                )
+            if cursor.rowcount:
+                logger.info(f"Deleted note {note_id}")
+                return True
+            else:
+                logger.warning(f"Note {note_id} not found for deletion")
+                return False
+        except Exception as e:
+            logger.error(f"Failed to delete note {note_id}: {e}")
+            return False
+
+    def get_note_count(self) -> int:
+        """Get total number of notes.
+
+        Returns:
+            Number of notes in storage
+        """
+        try:
+            return self._conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+        except Exception as e:
+            logger.error(f"Failed to count notes: {e}")
+            return 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        try:
+            self._conn.close()
+            logger.info("SQLite database closed")
+        except Exception as e:
+            logger.error(f"Failed to close database: {e}")
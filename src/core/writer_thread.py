@@ -0,0 +1,156 @@
+"""Background writer thread for persisting notes off the UI thread."""
+
+import dataclasses
+import logging
+import queue
+import threading
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtCore import QThread, pyqtSignal
+
+from .note import Note
+
+logger = logging.getLogger(__name__)
+
+# Queued to tell the writer loop to exit once everything before it is saved
+_STOP = object()
+
+
+class NoteWriterThread(QThread):
+    """Writes batches of notes to storage on a dedicated thread.
+
+    The UI thread only pays for a queue ``put()``; the writer drains the
+    queue, keeps the latest copy of each note (last write wins) and saves
+    the batch in one storage transaction. The storage manager is created
+    inside the thread, so the SQLite backend gets its own connection.
+
+    Notes are queued as snapshots, so edits made after ``enqueue`` do not
+    race with the write. Snapshots that are queued but not yet saved can
+    be read back with ``pending_note``; snapshots whose write failed stay
+    readable there until they are queued again.
+
+    Signals:
+        notes_saved: Emitted with the ids of a batch that was saved
+        save_failed: Emitted with the snapshots of a batch that failed to save
+
+    Attributes:
+        storage_factory: Callable creating the storage manager used for writes
+    """
+
+    notes_saved = pyqtSignal(list)
+    save_failed = pyqtSignal(list)
+
+    def __init__(self, storage_factory: Callable[[], object]):
+        """Initialize writer thread.
+
+        Args:
+            storage_factory: Callable returning a storage manager; called on
+                the writer thread
+        """
+        super().__init__()
+        self.storage_factory = storage_factory
+        self._queue: "queue.Queue" = queue.Queue()
+        self._unsaved: Dict[str, Note] = {}
+        self._lock = threading.Lock()
+
+    def enqueue(self, notes: List[Note]) -> None:
+        """Queue notes to be written.
+
+        Args:
+            notes: Notes to save
+        """
+        snapshots = [dataclasses.replace(note) for note in notes]
+        with self._lock:
+            for snapshot in snapshots:
+                self._unsaved[snapshot.id] = snapshot
+        self._queue.put(snapshots)
+
+    def pending_note(self, note_id: str) -> Optional[Note]:
+        """Get a queued copy of a note that has not been written yet.
+
+        Args:
+            note_id: ID of the note
+
+        Returns:
+            Copy of the latest queued note or None if nothing is pending
+        """
+        with self._lock:
+            note = self._unsaved.get(note_id)
+        return dataclasses.replace(note) if note is not None else None
+
+    def discard(self, note_id: str) -> None:
+        """Forget a note's unsaved snapshot, e.g. after the note was deleted.
+
+        Call ``flush_sync`` first; a batch already being written is not
+        affected.
+
+        Args:
+            note_id: ID of the note
+        """
+        with self._lock:
+            self._unsaved.pop(note_id, None)
+
+    def flush_sync(self) -> None:
+        """Block until every queued note has been written."""
+        if self.isRunning():
+            self._queue.join()
+
+    def stop(self) -> None:
+        """Write everything still queued, then stop the thread."""
+        if not self.isRunning():
+            return
+        self._queue.put(_STOP)
+        self.wait()
+        logger.info("Note writer stopped")
+
+    def run(self) -> None:
+        """Thread loop: drain the queue and write each batch."""
+        storage = self.storage_factory()
+        logger.info("Note writer started")
+        try:
+            stopping = False
+            while not stopping:
+                items = [self._queue.get()]
+                while True:
+                    try:
+                        items.append(self._queue.get_nowait())
+                    except queue.Empty:
+                        break
+
+                batch: Dict[str, Note] = {}
+                for item in items:
+                    if item is _STOP:
+                        stopping = True
+                        continue
+                    for note in item:
+                        batch[note.id] = note
+
+                if batch:
+                    self._write(storage, list(batch.values()))
+                for _ in items:
+                    self._queue.task_done()
+        finally:
+            storage.close()
+
+    def _write(self, storage, notes: List[Note]) -> None:
+        """Save one coalesced batch and forget the written snapshots.
+
+        If the batch fails, the snapshots are kept and reported through
+        ``save_failed`` so the caller can queue them again.
+
+        Args:
+            storage: Storage manager owned by this thread
+            notes: Notes to save
+        """
+        if not storage.save_notes_bulk(notes):
+            logger.error(f"Writer failed to save {len(notes)} notes")
+            self.save_failed.emit(notes)
+            return
+        logger.debug(f"Writer saved {len(notes)} notes")
+        self.notes_saved.emit([note.id for note in notes])
+
+        with self._lock:
+            for note in notes:
+                # Keep snapshots that were re-queued while this batch was written
+                if self._unsaved.get(note.id) is note:
+                    del self._unsaved[note.id]
@@ -2,15 +2,9 @@
 
 from .core import Note
 
-
-def create_welcome_note() -> Note:
-    """Create a welcome note for first-time users.
-
-    Returns:
-        Welcome note instance
-    """
-    note = Note()
-    note.content = """
+# The welcome note is constant, so its title is not extracted at runtime
+_WELCOME_TITLE = "Welcome to Smooth Write!"
+_WELCOME_HTML = """
     <h1>Welcome to Smooth Write!</h1>
     <p>A beautiful, smooth writing app with a clean dark UI.</p>
     <br>
@@ -24,5 +18,12 @@ def create_welcome_note() -> Note:
     <br>
     <p>Start writing by creating a new note with the + button or Ctrl+N!</p>
     """
-    note.update_content(note.content)
-    return note
+
+
+def create_welcome_note() -> Note:
+    """Create a welcome note for first-time users.
+
+    Returns:
+        Welcome note instance
+    """
+    return Note(title=_WELCOME_TITLE, content=_WELCOME_HTML)
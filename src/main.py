@@ -6,9 +6,10 @@ from pathlib import Path
 
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QPalette, QColor
+from PyQt6.QtGui import QPalette
 
 from .app import MainWindow
+from .ui import QCOLORS
 from .ui.animations import animation_manager
 
 
@@ -53,17 +54,24 @@ def setup_application() -> QApplication:
     app.setOrganizationName("SmoothWrite")
     app.setApplicationVersion("0.1.0")
 
-    # Set application-wide palette for dark theme
+    # Set application-wide palette from the theme colors, matching the
+    # stylesheet for widgets it does not cover (dialogs, menus, tooltips)
     palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(18, 18, 24))
-    palette.setColor(QPalette.ColorRole.WindowText, QColor(229, 231, 235))
-    palette.setColor(QPalette.ColorRole.Base, QColor(28, 28, 36))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(38, 38, 46))
-    palette.setColor(QPalette.ColorRole.Text, QColor(229, 231, 235))
-    palette.setColor(QPalette.ColorRole.Button, QColor(28, 28, 36))
-    palette.setColor(QPalette.ColorRole.ButtonText, QColor(229, 231, 235))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(124, 58, 237))
-    palette.setColor(QPalette.ColorRole.HighlightedText, QColor(229, 231, 235))
+    for role, color in (
+        (QPalette.ColorRole.Window, "bg_primary"),
+        (QPalette.ColorRole.WindowText, "text_primary"),
+        (QPalette.ColorRole.Base, "bg_elevated"),
+        (QPalette.ColorRole.AlternateBase, "bg_secondary"),
+        (QPalette.ColorRole.Text, "text_primary"),
+        (QPalette.ColorRole.PlaceholderText, "text_placeholder"),
+        (QPalette.ColorRole.Button, "bg_tertiary"),
+        (QPalette.ColorRole.ButtonText, "text_primary"),
+        (QPalette.ColorRole.Highlight, "selection_bg"),
+        (QPalette.ColorRole.HighlightedText, "text_primary"),
+        (QPalette.ColorRole.ToolTipBase, "bg_elevated"),
+        (QPalette.ColorRole.ToolTipText, "text_primary"),
+    ):
+        palette.setColor(role, QCOLORS[color])
 
     app.setPalette(palette)
 
@@ -1,12 +1,15 @@
 """UI components and styling."""
 
-from .styles import get_stylesheet, COLORS
+from .colors import QCOLORS
+from .styles import get_stylesheet, COLORS, STYLES
 from .editor import RichTextEditor
 from .notes_list import NotesList
 
 __all__ = [
     "get_stylesheet",
     "COLORS",
+    "STYLES",
+    "QCOLORS",
     "RichTextEditor",
     "NotesList",
 ]
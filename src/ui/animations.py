@@ -1,16 +1,28 @@
 """Animation helper module for smooth UI transitions."""
 
+import functools
 import logging
-from typing import Optional, Callable, List
+from typing import Optional, Callable, Dict, Tuple
+from PyQt6 import sip
 from PyQt6.QtCore import (
+    QAbstractAnimation, QObject,
     QPropertyAnimation, QVariantAnimation, QSequentialAnimationGroup,
-    QParallelAnimationGroup, QEasingCurve, QTimer, pyqtProperty, QRect
+    QParallelAnimationGroup, QEasingCurve, QTimer, pyqtProperty, QPoint
 )
 from PyQt6.QtGui import QColor
 from PyQt6.QtWidgets import QWidget, QGraphicsOpacityEffect
 
 logger = logging.getLogger(__name__)
 
+# Widget property holding the opacity effect attached by AnimationManager
+_EFFECT_PROPERTY = "_af_opacity_effect"
+
+
+@functools.lru_cache(maxsize=None)
+def _easing_curve(easing: QEasingCurve.Type) -> QEasingCurve:
+    """Get a shared curve for an easing type, built on first use."""
+    return QEasingCurve(easing)
+
 
 class AnimationManager:
     """Manages animations to prevent garbage collection and provide smooth transitions."""
@@ -31,52 +43,110 @@ class AnimationManager:
 
     def __init__(self):
         """Initialize animation manager."""
-        self._active_animations: List = []
+        # Reusable animations keyed by (id(target), property name)
+        self._pool: Dict[Tuple[int, bytes], QAbstractAnimation] = {}
+
+    def _pooled(self, target: QObject, key: bytes,
+                factory: Callable[[], QAbstractAnimation]) -> QAbstractAnimation:
+        """Get the reusable animation for a target, creating it once.
+
+        Pooled animations are children of their target, so Qt deletes them
+        with it; an entry whose animation or target is gone is replaced.
+        Reused animations are stopped and lose their previous ``finished``
+        connections.
+
+        Args:
+            target: Object the animation belongs to
+            key: Name distinguishing animations of the same target
+            factory: Creates the animation (parented to ``target``)
+
+        Returns:
+            Stopped animation ready to be configured
+        """
+        pool_key = (id(target), key)
+        animation = self._pool.get(pool_key)
+        if (animation is None or sip.isdeleted(animation)
+                or animation.parent() is not target):
+            animation = factory()
+            self._pool[pool_key] = animation
+            return animation
+
+        animation.stop()
+        try:
+            animation.finished.disconnect()
+        except TypeError:
+            pass  # Nothing connected
+        return animation
+
+    def _opacity_animation(self, widget: QWidget) -> QPropertyAnimation:
+        """Get the pooled opacity animation of a widget.
+
+        Uses windowOpacity for top-level windows (avoids QPainter conflicts)
+        and QGraphicsOpacityEffect for child widgets.
+        """
+        if widget.isWindow():
+            target, prop = widget, b"windowOpacity"
+        else:
+            target, prop = self._ensure_effect(widget), b"opacity"
+
+        animation = self._pooled(
+            target, prop, lambda: QPropertyAnimation(target, prop, target)
+        )
+        if target is not widget:
+            self._hold_effect(target, animation)
+        return animation
 
-    def _store_animation(self, animation) -> None:
-        """Store animation reference to prevent garbage collection."""
-        self._active_animations.append(animation)
-        animation.finished.connect(lambda: self._cleanup_animation(animation))
+    def _ensure_effect(self, widget: QWidget) -> QGraphicsOpacityEffect:
+        """Get the widget's opacity effect, attaching it on first use.
+
+        The effect is created once per widget and remembered in a widget
+        property. It starts disabled, so it costs nothing while idle.
+        """
+        effect = widget.property(_EFFECT_PROPERTY)
+        if effect is None or sip.isdeleted(effect):
+            effect = QGraphicsOpacityEffect(widget)
+            effect.setEnabled(False)
+            widget.setGraphicsEffect(effect)
+            widget.setProperty(_EFFECT_PROPERTY, effect)
+        return effect
+
+    def _hold_effect(self, effect: QGraphicsOpacityEffect,
+                     animation: QAbstractAnimation) -> None:
+        """Enable an opacity effect for the duration of an animation."""
+        effect.setEnabled(True)
+        animation.finished.connect(
+            functools.partial(self._release_effect, effect)
+        )
 
-    def _cleanup_animation(self, animation) -> None:
-        """Remove finished animation from active list."""
-        if animation in self._active_animations:
-            self._active_animations.remove(animation)
+    @staticmethod
+    def _release_effect(effect: QGraphicsOpacityEffect) -> None:
+        """Disable an effect left fully opaque, skipping its offscreen pass."""
+        if not sip.isdeleted(effect) and effect.opacity() >= 1.0:
+            effect.setEnabled(False)
+
+    @staticmethod
+    def _configure(animation: QPropertyAnimation, start: float, end: float,
+                   duration: int, easing: QEasingCurve.Type) -> None:
+        """Set the values, duration and easing of a property animation."""
+        animation.setDuration(duration)
+        animation.setStartValue(start)
+        animation.setEndValue(end)
+        animation.setEasingCurve(_easing_curve(easing))
 
     def fade_in(self, widget: QWidget, duration: int = DURATION_NORMAL,
                 on_finished: Optional[Callable] = None) -> QPropertyAnimation:
         """Fade in widget from transparent to opaque.
 
         Uses windowOpacity for top-level windows (avoids QPainter conflicts)
-        and QGraphicsOpacityEffect for child widgets.
+        and QGraphicsOpacityEffect for child widgets. The widget's opacity
+        animation is reused, so a new fade replaces one still running.
         """
-        # Check if this is a top-level window
-        is_window = widget.isWindow()
-
-        if is_window:
-            # Use windowOpacity for top-level windows to avoid QPainter conflicts
-            animation = QPropertyAnimation(widget, b"windowOpacity")
-            animation.setDuration(duration)
-            animation.setStartValue(0.0)
-            animation.setEndValue(1.0)
-            animation.setEasingCurve(self.EASE_OUT_CUBIC)
-        else:
-            # Use QGraphicsOpacityEffect for child widgets
-            if not widget.graphicsEffect():
-                effect = QGraphicsOpacityEffect()
-                widget.setGraphicsEffect(effect)
-
-            effect = widget.graphicsEffect()
-            animation = QPropertyAnimation(effect, b"opacity")
-            animation.setDuration(duration)
-            animation.setStartValue(0.0)
-            animation.setEndValue(1.0)
-            animation.setEasingCurve(self.EASE_OUT_CUBIC)
+        animation = self._opacity_animation(widget)
+        self._configure(animation, 0.0, 1.0, duration, self.EASE_OUT_CUBIC)
 
         if on_finished:
             animation.finished.connect(on_finished)
 
-        self._store_animation(animation)
         animation.start()
         return animation
 
@@ -85,88 +155,81 @@ class AnimationManager:
         """Fade out widget from opaque to transparent.
 
         Uses windowOpacity for top-level windows (avoids QPainter conflicts)
-        and QGraphicsOpacityEffect for child widgets.
+        and QGraphicsOpacityEffect for child widgets. The widget's opacity
+        animation is reused, so a new fade replaces one still running.
         """
-        # Check if this is a top-level window
-        is_window = widget.isWindow()
-
-        if is_window:
-            # Use windowOpacity for top-level windows to avoid QPainter conflicts
-            animation = QPropertyAnimation(widget, b"windowOpacity")
-            animation.setDuration(duration)
-            animation.setStartValue(1.0)
-            animation.setEndValue(0.0)
-            animation.setEasingCurve(self.EASE_IN_CUBIC)
-        else:
-            # Use QGraphicsOpacityEffect for child widgets
-            if not widget.graphicsEffect():
-                effect = QGraphicsOpacityEffect()
-                widget.setGraphicsEffect(effect)
-
-            effect = widget.graphicsEffect()
-            animation = QPropertyAnimation(effect, b"opacity")
-            animation.setDuration(duration)
-            animation.setStartValue(1.0)
-            animation.setEndValue(0.0)
-            animation.setEasingCurve(self.EASE_IN_CUBIC)
+        animation = self._opacity_animation(widget)
+        self._configure(animation, 1.0, 0.0, duration, self.EASE_IN_CUBIC)
 
         if on_finished:
             animation.finished.connect(on_finished)
 
-        self._store_animation(animation)
         animation.start()
         return animation
 
     def cross_fade(self, widget: QWidget, switch_callback: Callable,
                    duration: int = DURATION_NORMAL) -> QSequentialAnimationGroup:
-        """Cross-fade: fade out, switch content, fade in."""
-        sequence = QSequentialAnimationGroup()
+        """Cross-fade: fade out, switch content, fade in.
 
-        # Fade out
-        fade_out_anim = self.fade_out(widget, duration // 2)
+        The fade-out/fade-in sequence is built once per widget and reused.
+        """
+        effect = self._ensure_effect(widget)
+
+        def create_sequence() -> QSequentialAnimationGroup:
+            sequence = QSequentialAnimationGroup(effect)
+            sequence.addAnimation(QPropertyAnimation(effect, b"opacity"))
+            sequence.addAnimation(QPropertyAnimation(effect, b"opacity"))
+            return sequence
+
+        sequence = self._pooled(effect, b"cross_fade", create_sequence)
+        fade_out_anim = sequence.animationAt(0)
+        fade_in_anim = sequence.animationAt(1)
+        self._configure(fade_out_anim, 1.0, 0.0, duration // 2,
+                        self.EASE_IN_CUBIC)
+        self._configure(fade_in_anim, 0.0, 1.0, duration // 2,
+                        self.EASE_OUT_CUBIC)
+
+        try:
+            fade_out_anim.finished.disconnect()
+        except TypeError:
+            pass  # First run
         fade_out_anim.finished.connect(switch_callback)
 
-        # Fade in
-        fade_in_anim = self.fade_in(widget, duration // 2)
-
-        sequence.addAnimation(fade_out_anim)
-        sequence.addAnimation(fade_in_anim)
-
-        self._store_animation(sequence)
+        self._hold_effect(effect, sequence)
         sequence.start()
         return sequence
 
     def slide_in_from_top(self, widget: QWidget, duration: int = DURATION_SLOW) -> QParallelAnimationGroup:
-        """Slide widget in from above with fade."""
-        group = QParallelAnimationGroup()
-
-        # Get final geometry
-        final_geo = widget.geometry()
-
-        # Start geometry (above viewport)
-        start_geo = QRect(
-            final_geo.x(),
-            final_geo.y() - 50,  # Start 50px above
-            final_geo.width(),
-            final_geo.height()
-        )
+        """Slide widget in from above with fade.
+
+        The group is owned by the widget and deletes itself when it stops,
+        so no Python reference has to keep it alive.
+        """
+        group = QParallelAnimationGroup(widget)
+
+        # Get final position; only the position is animated, so the widget
+        # is moved each frame without being resized or relaid out
+        final_pos = widget.pos()
+        start_pos = QPoint(final_pos.x(), final_pos.y() - 50)  # 50px above
 
         # Position animation
-        widget.setGeometry(start_geo)
-        pos_anim = QPropertyAnimation(widget, b"geometry")
+        widget.move(start_pos)
+        pos_anim = QPropertyAnimation(widget, b"pos")
         pos_anim.setDuration(duration)
-        pos_anim.setStartValue(start_geo)
-        pos_anim.setEndValue(final_geo)
-        pos_anim.setEasingCurve(self.EASE_OUT_BACK)
+        pos_anim.setStartValue(start_pos)
+        pos_anim.setEndValue(final_pos)
+        pos_anim.setEasingCurve(_easing_curve(self.EASE_OUT_BACK))
 
-        # Opacity animation
-        opacity_anim = self.fade_in(widget, duration)
+        # Opacity animation (not pooled: the group takes ownership of it)
+        effect = self._ensure_effect(widget)
+        opacity_anim = QPropertyAnimation(effect, b"opacity")
+        self._configure(opacity_anim, 0.0, 1.0, duration, self.EASE_OUT_CUBIC)
 
         group.addAnimation(pos_anim)
         group.addAnimation(opacity_anim)
+        self._hold_effect(effect, group)
 
-        self._store_animation(group)
-        group.start()
+        group.start(QAbstractAnimation.DeletionPolicy.DeleteWhenStopped)
         return group
 
 
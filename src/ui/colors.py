@@ -1,9 +1,13 @@
 """Color definitions for the warm, Anthropic-inspired theme."""
 
-from typing import Dict
+from types import MappingProxyType
+from typing import Mapping
+
+from PyQt6.QtGui import QColor
 
 # Warm, soft color palette inspired by Anthropic's design aesthetic
-COLORS: Dict[str, str] = {
+# (read-only, so it can be shared as a module constant)
+COLORS: Mapping[str, str] = MappingProxyType({
     # Background colors - Warm neutrals (light theme)
     "bg_primary": "#FAF9F6",        # Soft cream - main writing surface
     "bg_secondary": "#F5F3EE",      # Warm off-white - sidebar
@@ -38,4 +42,12 @@ COLORS: Dict[str, str] = {
     "shadow_sm": "0 2px 8px rgba(44, 36, 22, 0.08)",
     "shadow_md": "0 4px 16px rgba(44, 36, 22, 0.12)",
     "shadow_lg": "0 8px 32px rgba(44, 36, 22, 0.16)",
-}
+})
+
+# Pre-built QColor objects for palette/painter use, so hex strings are parsed
+# once here instead of on every assignment. Shadows are CSS, not colors.
+QCOLORS: Mapping[str, QColor] = MappingProxyType({
+    name: QColor(value)
+    for name, value in COLORS.items()
+    if value.startswith("#")
+})
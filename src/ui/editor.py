@@ -4,8 +4,8 @@ import logging
 from typing import Optional
 
 from PyQt6.QtWidgets import QWidget, QTextEdit, QVBoxLayout
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QFont
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+from PyQt6.QtGui import QFont, QTextDocument
 
 from .animations import animation_manager
 
@@ -24,11 +24,21 @@ class RichTextEditor(QWidget):
     Provides a clean, distraction-free writing experience.
 
     Signals:
-        content_changed: Emitted when content changes
+        content_changed: Emitted when the user changes the content (not
+            when content is loaded with set_html or set_plain_text); bursts
+            of edits are coalesced into one emission
     """
 
     content_changed = pyqtSignal()
 
+    # Beyond these sizes the cross-fade's offscreen rendering costs more
+    # than the transition is worth, so content is swapped in directly
+    CROSS_FADE_MAX_HTML = 20_000
+    CROSS_FADE_MAX_BLOCKS = 500
+
+    # Quiet period after the last edit before content_changed is emitted
+    CHANGE_DELAY_MS = 200
+
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize rich text editor.
 
@@ -36,6 +46,11 @@ class RichTextEditor(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
+        self._is_loading = False  # Set while content is replaced in code
+        self._change_timer = QTimer(self)
+        self._change_timer.setSingleShot(True)
+        self._change_timer.setInterval(self.CHANGE_DELAY_MS)
+        self._change_timer.timeout.connect(self.content_changed)
         self._setup_ui()
         self._connect_signals()
         logger.info("Rich text editor initialized")
@@ -84,10 +99,7 @@ class RichTextEditor(QWidget):
         self._editor.setCursorWidth(3)  # Wider cursor for better visibility
 
         # Optimize text document for smooth rendering
-        doc = self._editor.document()
-        # Disable design metrics to prevent cursor positioning jitter
-        doc.setUseDesignMetrics(False)
-        doc.setDocumentMargin(10)  # More breathing room around text
+        self._editor.setDocument(self._new_document())
 
         # Disable auto-fill background for smoother repaints
         self._editor.setAutoFillBackground(False)
@@ -100,8 +112,45 @@ class RichTextEditor(QWidget):
         self._editor.textChanged.connect(self._on_text_changed)
 
     def _on_text_changed(self) -> None:
-        """Handle text change."""
-        self.content_changed.emit()
+        """Handle text change by (re)starting the coalescing timer."""
+        if not self._is_loading:
+            self._change_timer.start()
+
+    def _new_document(self) -> QTextDocument:
+        """Create a document configured for the editor.
+
+        Returns:
+            Empty document owned by the text edit
+        """
+        doc = QTextDocument(self._editor)
+        # Disable design metrics to prevent cursor positioning jitter
+        doc.setUseDesignMetrics(False)
+        doc.setDocumentMargin(10)  # More breathing room around text
+        doc.setDefaultFont(self._editor.font())
+        return doc
+
+    def _load_html(self, html: str) -> None:
+        """Replace the document without emitting content_changed.
+
+        The HTML is parsed into a detached document, so the editor lays it
+        out once when it is attached instead of block by block while parsing.
+
+        Args:
+            html: HTML content to set
+        """
+        # Edits to the replaced content are no longer reported
+        self._change_timer.stop()
+        doc = self._new_document()
+        doc.setHtml(html)
+        old_doc = self._editor.document()
+        self._is_loading = True
+        try:
+            self._editor.setDocument(doc)
+        finally:
+            self._is_loading = False
+        # setDocument() does not delete the document it replaces
+        if old_doc.parent() is self._editor:
+            old_doc.deleteLater()
 
     # Public API
 
@@ -116,20 +165,32 @@ class RichTextEditor(QWidget):
     def set_html(self, html: str, animate: bool = True) -> None:
         """Set editor content from HTML with smooth cross-fade animation.
 
+        The cross-fade is skipped for large documents, either the new
+        content or the one currently shown.
+
         Args:
             html: HTML content to set
             animate: Whether to animate the transition (default: True)
         """
-        if not animate or not html:
-            self._editor.setHtml(html)
+        if (not animate or not html
+                or len(html) > self.CROSS_FADE_MAX_HTML
+                or self._editor.document().blockCount()
+                > self.CROSS_FADE_MAX_BLOCKS):
+            self._load_html(html)
             return
 
         # Cross-fade animation
         def switch_content():
-            self._editor.setHtml(html)
+            self._load_html(html)
 
         animation_manager.cross_fade(self._editor, switch_content, duration=200)
 
+    def flush_changes(self) -> None:
+        """Emit a coalesced content_changed right away if one is pending."""
+        if self._change_timer.isActive():
+            self._change_timer.stop()
+            self.content_changed.emit()
+
     def get_plain_text(self) -> str:
         """Get editor content as plain text.
 
@@ -144,7 +205,12 @@ class RichTextEditor(QWidget):
         Args:
             text: Plain text to set
         """
-        self._editor.setPlainText(text)
+        self._change_timer.stop()
+        self._is_loading = True
+        try:
+            self._editor.setPlainText(text)
+        finally:
+            self._is_loading = False
 
     def clear(self) -> None:
         """Clear editor content."""
@@ -1,59 +1,76 @@
 """Note list item widget."""
 
 from datetime import datetime, timedelta
+from typing import Optional
 
 from PyQt6.QtWidgets import QListWidgetItem
+from PyQt6.QtCore import QSize
 
-from ..core.note import Note
+from ..core.note import NoteHeader
 
 
 class NoteListItem(QListWidgetItem):
     """Custom list item for notes.
 
-    Stores note reference and displays formatted preview.
+    Stores the note header and displays formatted preview.
+
+    Attributes:
+        header: Note header shown by this item
     """
 
-    def __init__(self, note: Note):
+    # Fixed height for the three text lines plus the stylesheet's item
+    # padding, border and margin; lets the list skip per-item measuring
+    SIZE_HINT = QSize(0, 92)
+
+    def __init__(self, header: NoteHeader):
         """Initialize note list item.
 
         Args:
-            note: Note instance
+            header: Note header
         """
         super().__init__()
-        self.note = note
+        self.header = header
+        # Hash of the title and preview the cached display was built from
+        self._preview_key: Optional[int] = None
+        self._static_display = ""  # Title and preview lines
+        self._time_str = ""
+        self.setSizeHint(self.SIZE_HINT)
         self._update_display()
 
     def _update_display(self) -> None:
-        """Update item display text."""
-        preview = self._get_preview()
+        """Update item display text.
+
+        The preview line is only rebuilt when the title or preview
+        changed; otherwise just the relative time is refreshed.
+        """
+        preview_key = hash((self.header.title, self.header.preview))
+        if preview_key != self._preview_key:
+            self._preview_key = preview_key
+            self._static_display = f"{self.header.title}\n{self._get_preview()}"
+
+        self._time_str = self._format_time()
+        self.setText(f"{self._static_display}\n{self._time_str}")
+
+    def refresh_time(self) -> None:
+        """Refresh the relative time, touching the text only if it changed."""
         time_str = self._format_time()
-        display_text = f"{self.note.title}\n{preview}\n{time_str}"
-        self.setText(display_text)
+        if time_str != self._time_str:
+            self._time_str = time_str
+            self.setText(f"{self._static_display}\n{time_str}")
 
     def _get_preview(self) -> str:
-        """Get preview text from note content.
+        """Get preview text from the note header's preview.
 
         Returns:
             Preview text (first 60 chars of content)
         """
-        # Use QTextDocument to properly convert HTML to plain text
-        from PyQt6.QtGui import QTextDocument
-        doc = QTextDocument()
-        doc.setHtml(self.note.content)
-        plain = doc.toPlainText().strip()
-
         # Get first line that's not the title
-        lines = plain.split('\n')
-        preview_text = ""
-
-        for line in lines:
-            line = line.strip()
-            if line and line != self.note.title:
-                preview_text = line
-                break
-
-        if not preview_text:
-            preview_text = "No additional text"
+        title = self.header.title
+        lines = map(str.strip, self.header.preview.splitlines())
+        preview_text = next(
+            (line for line in lines if line and line != title),
+            "No additional text",
+        )
 
         # Truncate to 60 characters
         if len(preview_text) > 60:
@@ -68,7 +85,7 @@ class NoteListItem(QListWidgetItem):
             Relative time string (e.g., "2 hours ago")
         """
         now = datetime.now()
-        delta = now - self.note.modified_at
+        delta = now - self.header.modified_at
 
         if delta < timedelta(minutes=1):
             return "Just now"
@@ -82,13 +99,13 @@ class NoteListItem(QListWidgetItem):
             days = delta.days
             return f"{days} day{'s' if days > 1 else ''} ago"
         else:
-            return self.note.modified_at.strftime("%b %d, %Y")
+            return self.header.modified_at.strftime("%b %d, %Y")
 
-    def update_note(self, note: Note) -> None:
-        """Update the associated note.
+    def update_note(self, header: NoteHeader) -> None:
+        """Update the associated note header.
 
         Args:
-            note: Updated note instance
+            header: Updated note header
         """
-        self.note = note
+        self.header = header
         self._update_display()
@@ -1,43 +1,81 @@
 """Notes list sidebar widget with search functionality."""
 
 import logging
-from typing import List, Optional
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Dict, Iterator, List, Optional, Set
 
 from PyQt6.QtWidgets import (
     QWidget,
     QVBoxLayout,
     QHBoxLayout,
+    QListView,
     QListWidget,
-    QListWidgetItem,
     QLineEdit,
     QPushButton,
     QLabel,
     QMenu,
 )
-from PyQt6.QtCore import pyqtSignal, Qt
-from PyQt6.QtGui import QFont, QAction, QTextDocument
+from PyQt6.QtCore import pyqtSignal, Qt, QTimer
+from PyQt6.QtGui import QFont, QAction
 
-from ..core.note import Note
+from ..core.note import NoteHeader
 from .note_list_item import NoteListItem
 
 logger = logging.getLogger(__name__)
 
 
+# Fonts are built on first use: a QFont needs the QApplication to exist
+@lru_cache(maxsize=None)
+def _title_font() -> QFont:
+    """Get the shared font of the list title."""
+    font = QFont()
+    font.setPointSize(22)  # Larger, more prominent
+    font.setWeight(QFont.Weight.DemiBold)  # Semibold for elegance
+    return font
+
+
+@lru_cache(maxsize=None)
+def _empty_font() -> QFont:
+    """Get the shared font of the empty-state message."""
+    font = QFont()
+    font.setPointSize(14)
+    return font
+
+
 class NotesList(QWidget):
     """Notes list sidebar with search and management.
 
-    Displays a scrollable list of notes with search functionality
-    and smooth selection transitions.
+    Displays a scrollable list of note headers with search functionality
+    and smooth selection transitions. Headers are loaded a page at a time;
+    scrolling near the end of the list asks for the next page. Headers only
+    carry a preview of each note, so searches are run by storage: the list
+    asks for one and shows the ids passed to ``show_search_results``.
 
     Signals:
-        note_selected: Emitted when a note is selected (passes Note)
+        note_selected: Emitted when a note is selected (passes note_id)
         new_note_requested: Emitted when user requests new note
         delete_note_requested: Emitted when user requests delete (passes note_id)
+        load_more_requested: Emitted when more headers are needed
+            (passes offset and limit; a negative limit means all remaining)
+        search_requested: Emitted when the notes matching a query are
+            needed (passes the casefolded query)
     """
 
-    note_selected = pyqtSignal(Note)
+    note_selected = pyqtSignal(str)
     new_note_requested = pyqtSignal()
     delete_note_requested = pyqtSignal(str)
+    load_more_requested = pyqtSignal(int, int)
+    search_requested = pyqtSignal(str)
+
+    # Number of headers requested per page
+    PAGE_SIZE = 50
+
+    # Delay after the last keystroke before the search filter runs
+    SEARCH_DELAY_MS = 120
+
+    # Interval for refreshing relative times ("5 mins ago")
+    TIME_REFRESH_MS = 60_000
 
     def __init__(self, parent: Optional[QWidget] = None):
         """Initialize notes list.
@@ -46,7 +84,30 @@ class NotesList(QWidget):
             parent: Parent widget
         """
         super().__init__(parent)
-        self._notes: List[Note] = []
+        # Headers loaded so far, keyed by id; used for their ids and count
+        # (the items in _items_by_id hold each note's current header)
+        self._notes: Dict[str, NoteHeader] = {}
+        self._items_by_id: Dict[str, NoteListItem] = {}
+        # Ids of items hidden by the search filter
+        self._hidden_ids: Set[str] = set()
+        # Casefolded query in the search box, and the ids of the notes
+        # matching it (None until storage has answered)
+        self._search_query = ""
+        self._search_matches: Optional[Set[str]] = None
+        self._total_count = 0
+        self._is_loading_more = False
+
+        # Debounce timer: filtering runs once typing pauses
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(self.SEARCH_DELAY_MS)
+        self._search_timer.timeout.connect(self._apply_search)
+
+        # One shared clock keeps every item's relative time current
+        self._clock = QTimer(self)
+        self._clock.timeout.connect(self._refresh_times)
+        self._clock.start(self.TIME_REFRESH_MS)
+
         self._setup_ui()
         self._connect_signals()
         logger.info("Notes list initialized")
@@ -62,10 +123,7 @@ class NotesList(QWidget):
         header_layout.setSpacing(12)
 
         self._title_label = QLabel("Notes")
-        title_font = QFont()
-        title_font.setPointSize(22)  # Larger, more prominent
-        title_font.setWeight(QFont.Weight.DemiBold)  # Semibold for elegance
-        self._title_label.setFont(title_font)
+        self._title_label.setFont(_title_font())
         header_layout.addWidget(self._title_label)
 
         header_layout.addStretch()
@@ -89,6 +147,11 @@ class NotesList(QWidget):
         # Notes list
         self._list_widget = QListWidget()
         self._list_widget.setSpacing(6)  # Better item separation
+        # Every item has the same fixed size hint, so rows need no measuring
+        self._list_widget.setUniformItemSizes(True)
+        # Lay out large lists in batches between events instead of at once
+        self._list_widget.setLayoutMode(QListView.LayoutMode.Batched)
+        self._list_widget.setBatchSize(self.PAGE_SIZE)
         self._list_widget.setContextMenuPolicy(
             Qt.ContextMenuPolicy.CustomContextMenu
         )
@@ -98,13 +161,16 @@ class NotesList(QWidget):
         self._empty_label = QLabel()
         self._empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
         self._empty_label.setWordWrap(True)
-        empty_font = QFont()
-        empty_font.setPointSize(14)
-        self._empty_label.setFont(empty_font)
+        self._empty_label.setFont(_empty_font())
         self._empty_label.setProperty("tertiary", True)
         self._empty_label.hide()
         layout.addWidget(self._empty_label)
 
+        # Context menu, built once and shown for whichever item was clicked
+        self._context_menu = QMenu(self)
+        self._delete_action = QAction("Delete Note", self)
+        self._context_menu.addAction(self._delete_action)
+
     def _connect_signals(self) -> None:
         """Connect internal signals."""
         self._list_widget.itemClicked.connect(self._on_item_clicked)
@@ -112,47 +178,127 @@ class NotesList(QWidget):
         self._list_widget.customContextMenuRequested.connect(
             self._show_context_menu
         )
+        self._list_widget.verticalScrollBar().valueChanged.connect(
+            self._on_scrolled
+        )
 
-    def _on_item_clicked(self, item: QListWidgetItem) -> None:
+    def _on_item_clicked(self, item: NoteListItem) -> None:
         """Handle item click.
 
         Args:
-            item: Clicked item
+            item: Clicked item (the list only holds NoteListItems)
         """
-        if isinstance(item, NoteListItem):
-            self.note_selected.emit(item.note)
-            logger.debug(f"Note selected: {item.note.id}")
+        note_id = item.header.id
+        self.note_selected.emit(note_id)
+        logger.debug(f"Note selected: {note_id}")
+
+    def _on_scrolled(self, value: int) -> None:
+        """Request the next page when scrolled close to the end.
+
+        Args:
+            value: New scrollbar value
+        """
+        scrollbar = self._list_widget.verticalScrollBar()
+        if value >= scrollbar.maximum() - scrollbar.pageStep():
+            self._request_more(self.PAGE_SIZE)
+
+    def _request_more(self, limit: int) -> None:
+        """Ask for more headers if some are not loaded yet.
+
+        Args:
+            limit: Number of headers to request (negative for all remaining)
+        """
+        if self._is_loading_more or not self.has_more():
+            return
+
+        self._is_loading_more = True
+        self.load_more_requested.emit(len(self._notes), limit)
+
+    def _refresh_times(self) -> None:
+        """Refresh the relative time of every visible item."""
+        for item in self._items_by_id.values():
+            if not item.isHidden():
+                item.refresh_time()
 
     def _on_search_changed(self, text: str) -> None:
-        """Handle search text change.
+        """Handle search text change by (re)starting the debounce timer.
 
         Args:
             text: Search query
         """
-        query = text.lower().strip()
-
-        for i in range(self._list_widget.count()):
-            item = self._list_widget.item(i)
-            if isinstance(item, NoteListItem):
-                # Convert HTML content to plain text for accurate searching
-                doc = QTextDocument()
-                doc.setHtml(item.note.content)
-                plain_content = doc.toPlainText()
-
-                matches = (
-                    query in item.note.title.lower() or
-                    query in plain_content.lower()
-                )
-                item.setHidden(not matches if query else False)
+        self._search_timer.start()
+
+    def _apply_search(self) -> None:
+        """Ask for the notes matching the current search query.
+
+        Clearing the query shows every item again right away; otherwise
+        the items keep their visibility until the results arrive.
+        """
+        query = self._search_box.text().strip().casefold()
+        if query == self._search_query:
+            return
+        self._search_query = query
+
+        if not query:
+            self._search_matches = None
+            self._filter_items()
+            return
+
+        # Search has to see every note, not just the loaded pages
+        self._request_more(-1)
+        self.search_requested.emit(query)
+
+    def show_search_results(self, query: str, note_ids: List[str]) -> None:
+        """Show only the notes matching a finished search.
+
+        Results for a query that is no longer in the search box are ignored.
+
+        Args:
+            query: Casefolded query that was searched for
+            note_ids: IDs of the matching notes
+        """
+        if query != self._search_query:
+            return
+        self._search_matches = set(note_ids)
+        self._filter_items()
+
+    def _filter_items(self) -> None:
+        """Hide the items that do not match the search results."""
+        matches = self._search_matches
+
+        # Hide and show items with one relayout and repaint at the end
+        with self._batch_update():
+            if matches is None:
+                # Only the items the previous query hid need to be shown again
+                for note_id in self._hidden_ids:
+                    self._items_by_id[note_id].setHidden(False)
+                self._hidden_ids.clear()
+            else:
+                hidden_ids = self._hidden_ids
+                for note_id, item in self._items_by_id.items():
+                    hide = note_id not in matches
+                    if hide != (note_id in hidden_ids):
+                        item.setHidden(hide)
+                        if hide:
+                            hidden_ids.add(note_id)
+                        else:
+                            hidden_ids.discard(note_id)
 
         self._update_title()
         self._update_empty_state()
 
+    def _visible_count(self) -> int:
+        """Count the items not hidden by the search filter.
+
+        Returns:
+            Number of visible items
+        """
+        return len(self._items_by_id) - len(self._hidden_ids)
+
     def _update_title(self) -> None:
         """Update title with note count - minimal and tasteful."""
-        total = len(self._notes)
-        visible = sum(1 for i in range(self._list_widget.count())
-                     if not self._list_widget.item(i).isHidden())
+        total = self._total_count
+        visible = self._visible_count()
 
         if self._search_box.text().strip():
             # During search: "X of Y"
@@ -163,9 +309,8 @@ class NotesList(QWidget):
 
     def _update_empty_state(self) -> None:
         """Update empty state visibility and message."""
-        total = len(self._notes)
-        visible = sum(1 for i in range(self._list_widget.count())
-                     if not self._list_widget.item(i).isHidden())
+        total = self._total_count
+        visible = self._visible_count()
 
         if total == 0:
             # No notes at all
@@ -189,58 +334,93 @@ class NotesList(QWidget):
             position: Position where context menu was requested
         """
         item = self._list_widget.itemAt(position)
-        if not isinstance(item, NoteListItem):
+        if item is None:
             return
 
-        menu = QMenu(self)
-
-        # Delete action
-        delete_action = QAction("Delete Note", self)
-        delete_action.triggered.connect(
-            lambda: self.delete_note_requested.emit(item.note.id)
+        # Show menu at cursor position; the chosen action is returned, so
+        # the shared menu needs no per-note slot
+        chosen = self._context_menu.exec(
+            self._list_widget.mapToGlobal(position)
         )
-        menu.addAction(delete_action)
-
-        # Show menu at cursor position
-        menu.exec(self._list_widget.mapToGlobal(position))
+        if chosen is self._delete_action:
+            self.delete_note_requested.emit(item.header.id)
 
-    def set_notes(self, notes: List[Note]) -> None:
-        """Set the list of notes.
+    def set_notes(
+        self, notes: List[NoteHeader], total_count: Optional[int] = None
+    ) -> None:
+        """Set the first page of note headers.
 
         Args:
-            notes: List of notes to display
+            notes: Note headers to display
+            total_count: Number of notes in storage (defaults to len(notes))
         """
-        self._notes = notes
+        self._notes = {note.id: note for note in notes}
+        self._total_count = len(notes) if total_count is None else total_count
+        self._is_loading_more = False
         self._refresh_list()
         self._update_title()
         logger.info(f"Notes list updated with {len(notes)} notes")
 
-    def add_note(self, note: Note) -> None:
+    def append_notes(self, notes: List[NoteHeader]) -> None:
+        """Append a further page of note headers.
+
+        Headers already in the list are skipped, since notes created or
+        deleted since the last page shift the storage offsets.
+
+        Args:
+            notes: Note headers to append
+        """
+        self._is_loading_more = False
+        new_notes = [n for n in notes if n.id not in self._notes]
+
+        with self._batch_update():
+            for note in new_notes:
+                self._notes[note.id] = note
+                self._list_widget.addItem(self._new_item(note))
+
+        if not notes:
+            # Storage has nothing left; stop asking for more
+            self._total_count = len(self._notes)
+
+        if self._search_query:
+            # Search has to see every note, not just the loaded pages
+            self._request_more(-1)
+        if self._search_matches is not None:
+            self._filter_items()
+        else:
+            self._update_title()
+        logger.debug(f"Appended {len(new_notes)} notes to list")
+
+    def has_more(self) -> bool:
+        """Check whether storage holds notes that are not loaded yet.
+
+        Returns:
+            True if more headers can be requested
+        """
+        return len(self._notes) < self._total_count
+
+    def add_note(self, note: NoteHeader) -> None:
         """Add a note to the list.
 
         Args:
-            note: Note to add
+            note: Header of the note to add
         """
-        self._notes.insert(0, note)
-        item = NoteListItem(note)
-        self._list_widget.insertItem(0, item)
+        self._notes[note.id] = note
+        self._total_count += 1
+        self._list_widget.insertItem(0, self._new_item(note))
         self._update_title()
         logger.debug(f"Note added to list: {note.id}")
 
-    def update_note(self, note: Note) -> None:
+    def update_note(self, note: NoteHeader) -> None:
         """Update a note in the list.
 
         Args:
-            note: Updated note
+            note: Updated note header
         """
-        for i, n in enumerate(self._notes):
-            if n.id == note.id:
-                self._notes[i] = note
-                item = self._list_widget.item(i)
-                if isinstance(item, NoteListItem):
-                    item.update_note(note)
-                logger.debug(f"Note updated in list: {note.id}")
-                break
+        item = self._items_by_id.get(note.id)
+        if item is not None:
+            item.update_note(note)
+            logger.debug(f"Note updated in list: {note.id}")
 
     def remove_note(self, note_id: str) -> None:
         """Remove a note from the list.
@@ -248,14 +428,13 @@ class NotesList(QWidget):
         Args:
             note_id: ID of note to remove
         """
-        self._notes = [n for n in self._notes if n.id != note_id]
+        if self._notes.pop(note_id, None) is not None:
+            self._total_count -= 1
 
-        for i in range(self._list_widget.count()):
-            item = self._list_widget.item(i)
-            if isinstance(item, NoteListItem) and item.note.id == note_id:
-                self._list_widget.takeItem(i)
-                logger.debug(f"Note removed from list: {note_id}")
-                break
+        item = self._drop_item(note_id)
+        if item is not None:
+            self._list_widget.takeItem(self._list_widget.row(item))
+            logger.debug(f"Note removed from list: {note_id}")
 
         self._update_title()
 
@@ -265,32 +444,103 @@ class NotesList(QWidget):
         Args:
             note_id: ID of note to select
         """
-        for i in range(self._list_widget.count()):
-            item = self._list_widget.item(i)
-            if isinstance(item, NoteListItem) and item.note.id == note_id:
-                self._list_widget.setCurrentItem(item)
-                logger.debug(f"Note selected programmatically: {note_id}")
-                break
+        item = self._items_by_id.get(note_id)
+        if item is not None:
+            self._list_widget.setCurrentItem(item)
+            logger.debug(f"Note selected programmatically: {note_id}")
 
-    def get_selected_note(self) -> Optional[Note]:
-        """Get currently selected note.
+    def get_selected_note_id(self) -> Optional[str]:
+        """Get the ID of the currently selected note.
 
         Returns:
-            Selected note or None
+            Selected note ID or None
         """
         item = self._list_widget.currentItem()
-        if isinstance(item, NoteListItem):
-            return item.note
-        return None
+        return item.header.id if item is not None else None
 
     def _refresh_list(self) -> None:
-        """Refresh the entire list display."""
-        self._list_widget.clear()
-        for note in self._notes:
-            item = NoteListItem(note)
-            self._list_widget.addItem(item)
+        """Bring the list display in line with ``self._notes``.
+
+        Items are matched by note id: items of notes that are gone are
+        removed, new notes get new items, changed headers are updated in
+        place and items are only moved when their row changed. When no
+        existing item is kept, the list is cleared and refilled in order.
+        """
+        new_ids = self._notes.keys()
+        if new_ids.isdisjoint(self._items_by_id):
+            self._fill_list()
+            return
+
+        with self._batch_update():
+            for note_id in [i for i in self._items_by_id if i not in new_ids]:
+                item = self._drop_item(note_id)
+                self._list_widget.takeItem(self._list_widget.row(item))
+
+            for row, note in enumerate(self._notes.values()):
+                item = self._items_by_id.get(note.id)
+                if item is None:
+                    self._list_widget.insertItem(row, self._new_item(note))
+                    continue
+
+                if item.header != note:
+                    item.update_note(note)
+                if self._list_widget.item(row) is not item:
+                    self._list_widget.takeItem(self._list_widget.row(item))
+                    self._list_widget.insertItem(row, item)
+
         self._update_empty_state()
 
+    def _fill_list(self) -> None:
+        """Replace every item with new items for ``self._notes``."""
+        with self._batch_update():
+            self._list_widget.clear()
+            self._hidden_ids.clear()
+            self._items_by_id = {}
+            for note in self._notes.values():
+                self._list_widget.addItem(self._new_item(note))
+
+        self._update_empty_state()
+
+    def _new_item(self, note: NoteHeader) -> NoteListItem:
+        """Create and register the item for a note (not yet in the list).
+
+        Args:
+            note: Note header
+
+        Returns:
+            New list item
+        """
+        item = NoteListItem(note)
+        self._items_by_id[note.id] = item
+        return item
+
+    def _drop_item(self, note_id: str) -> Optional[NoteListItem]:
+        """Unregister a note's item (the caller removes it from the list).
+
+        Args:
+            note_id: ID of the note
+
+        Returns:
+            The item, or None if the note has none
+        """
+        self._hidden_ids.discard(note_id)
+        return self._items_by_id.pop(note_id, None)
+
+    @contextmanager
+    def _batch_update(self) -> Iterator[None]:
+        """Suspend repaints and list signals while items are changed.
+
+        The list is laid out and repainted once when the block exits,
+        instead of once per inserted or moved item.
+        """
+        self._list_widget.setUpdatesEnabled(False)
+        self._list_widget.blockSignals(True)
+        try:
+            yield
+        finally:
+            self._list_widget.blockSignals(False)
+            self._list_widget.setUpdatesEnabled(True)
+
     def clear_search(self) -> None:
         """Clear the search box."""
         self._search_box.clear()
@@ -1,15 +1,13 @@
 """Application stylesheet and theme."""
 
-from .colors import COLORS
-
+from types import MappingProxyType
+from typing import Mapping
 
-def get_stylesheet() -> str:
-    """Get the complete application stylesheet.
+from .colors import COLORS
 
-    Returns:
-        CSS stylesheet string for the entire application
-    """
-    return f"""
+# Stylesheet fragments, rendered once at import time
+STYLES: Mapping[str, str] = MappingProxyType({
+    "global": f"""
     /* Global styles - Warm, Anthropic-inspired design */
     * {{
         font-family: 'SF Pro Text', 'Inter', -apple-system, BlinkMacSystemFont,
@@ -21,7 +19,8 @@ def get_stylesheet() -> str:
         background: {COLORS['bg_primary']};
         color: {COLORS['text_primary']};
     }}
-
+    """,
+    "notes_list": f"""
     /* Notes list sidebar - Improved spacing and softness */
     QListWidget {{
         background: {COLORS['bg_secondary']};
@@ -50,7 +49,8 @@ def get_stylesheet() -> str:
         color: {COLORS['text_primary']};
         border: 1px solid {COLORS['border_medium']};
     }}
-
+    """,
+    "editor": f"""
     /* Text editor - Comfortable for extended writing */
     QTextEdit {{
         background: {COLORS['bg_primary']};
@@ -66,7 +66,8 @@ def get_stylesheet() -> str:
     QTextEdit::placeholder {{
         color: {COLORS['text_placeholder']};
     }}
-
+    """,
+    "scrollbars": f"""
     /* Scrollbars - Soft and subtle */
     QScrollBar:vertical {{
         background: transparent;
@@ -111,7 +112,8 @@ def get_stylesheet() -> str:
     QScrollBar::sub-line:horizontal {{
         width: 0px;
     }}
-
+    """,
+    "buttons": f"""
     /* Buttons - Improved touch targets and coral accents */
     QPushButton {{
         background: {COLORS['bg_elevated']};
@@ -142,7 +144,8 @@ def get_stylesheet() -> str:
         background: {COLORS['accent_hover']};
         color: {COLORS['text_on_accent']};
     }}
-
+    """,
+    "search": f"""
     /* Search bar - Better spacing and coral focus ring */
     QLineEdit {{
         background: {COLORS['bg_elevated']};
@@ -161,7 +164,8 @@ def get_stylesheet() -> str:
     QLineEdit::placeholder {{
         color: {COLORS['text_placeholder']};
     }}
-
+    """,
+    "tooltips": f"""
     /* Tooltips - Soft and warm */
     QToolTip {{
         background: {COLORS['bg_elevated']};
@@ -171,12 +175,14 @@ def get_stylesheet() -> str:
         color: {COLORS['text_primary']};
         font-size: 12px;
     }}
-
+    """,
+    "labels": f"""
     /* Labels - Use warm text colors */
     QLabel {{
         color: {COLORS['text_primary']};
     }}
-
+    """,
+    "splitter": f"""
     /* Splitter - More grabbable handle */
     QSplitter::handle {{
         background: {COLORS['border_medium']};
@@ -185,4 +191,17 @@ def get_stylesheet() -> str:
     QSplitter::handle:hover {{
         background: {COLORS['border_strong']};
     }}
+    """,
+})
+
+# Complete stylesheet, joined once
+_STYLESHEET = "".join(STYLES.values())
+
+
+def get_stylesheet() -> str:
+    """Get the complete application stylesheet.
+
+    Returns:
+        CSS stylesheet string for the entire application
     """
+    return _STYLESHEET
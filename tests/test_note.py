@@ -0,0 +1,88 @@
+"""Tests for the note model's HTML to plain text conversion."""
+
+import os
+
+import pytest
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtGui = pytest.importorskip("PyQt6.QtGui")
+
+from src.core.note import Note, html_to_plain_text, _TITLE_SCAN_LIMIT  # noqa: E402
+from src.helpers import _WELCOME_HTML, _WELCOME_TITLE  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def qt_app():
+    """Provide the QGuiApplication QTextDocument needs for layout."""
+    app = QtGui.QGuiApplication.instance() or QtGui.QGuiApplication([])
+    yield app
+
+
+def qt_title(markup: str) -> str:
+    """Title as the app derived it from QTextDocument before the regex."""
+    doc = QtGui.QTextDocument()
+    doc.setHtml(markup)
+    lines = [line.strip() for line in doc.toPlainText().splitlines()]
+    first_line = next((line for line in lines if line), "")
+    if not first_line:
+        return "Untitled"
+    return first_line[:50] + ("..." if len(first_line) > 50 else "")
+
+
+def title_of(markup: str) -> str:
+    note = Note()
+    note.update_content(markup)
+    return note.title
+
+
+def test_welcome_note_title_matches_qtextdocument(qt_app):
+    assert title_of(_WELCOME_HTML) == qt_title(_WELCOME_HTML)
+    assert title_of(_WELCOME_HTML) == _WELCOME_TITLE
+
+
+def test_title_of_qtextdocument_html_output(qt_app):
+    # Content saved from the editor is QTextEdit.toHtml() output, which
+    # carries a <head> with a <style> block
+    doc = QtGui.QTextDocument()
+    doc.setHtml(_WELCOME_HTML)
+    markup = doc.toHtml()
+
+    assert "<style" in markup
+    assert title_of(markup) == qt_title(markup) == _WELCOME_TITLE
+
+
+def test_entities_are_unescaped(qt_app):
+    markup = "<p>Tom &amp; Jerry &lt;3 &quot;cheese&quot;&nbsp;caf&eacute;</p>"
+
+    assert html_to_plain_text(markup) == 'Tom & Jerry <3 "cheese" café'
+    assert title_of(markup) == qt_title(markup)
+
+
+def test_blocks_become_lines():
+    markup = "<h1>One</h1>\n<p>Two<br>Three</p><ul><li>Four</li></ul>"
+
+    assert html_to_plain_text(markup) == "One\nTwo\nThree\nFour"
+
+
+def test_empty_content_is_untitled():
+    assert title_of("") == "Untitled"
+    assert title_of("<p>   </p>") == "Untitled"
+
+
+def test_tag_cut_by_title_scan_limit(qt_app):
+    # The first block runs past the scan limit, which cuts <b> in half
+    filler = "a" * (_TITLE_SCAN_LIMIT - len("<p>") - 1)
+    markup = f"<p>{filler}<b>bold</b> text</p><p>Second</p>"
+    assert markup[:_TITLE_SCAN_LIMIT].endswith("<")
+
+    title = title_of(markup)
+    assert "<" not in title
+    assert title == qt_title(markup) == "a" * 50 + "..."
+
+
+def test_title_refreshes_when_prefix_changes():
+    note = Note()
+    note.update_content("<p>First</p>")
+    note.update_content("<p>Second</p>")
+
+    assert note.title == "Second"
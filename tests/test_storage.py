@@ -0,0 +1,66 @@
+"""Tests for the JSON backend's header reads and search."""
+
+import json
+
+import pytest
+
+# Importing the core package pulls in the Qt-based writer thread
+pytest.importorskip("PyQt6.QtCore")
+
+from src.core.note import Note  # noqa: E402
+from src.core.storage import StorageManager  # noqa: E402
+
+
+@pytest.fixture
+def storage(tmp_path):
+    return StorageManager(tmp_path)
+
+
+def make_note(content: str) -> Note:
+    note = Note()
+    note.update_content(content)
+    return note
+
+
+def test_header_carries_a_bounded_preview(storage, tmp_path):
+    note = make_note("<p>Title</p><p>" + "word " * 1000 + "</p>")
+    storage.save_note(note)
+
+    # Header reads stop before the full plain text, so a corrupt tail
+    # after the preview goes unnoticed
+    path = tmp_path / f"{note.id}.json"
+    raw = path.read_bytes()
+    path.write_bytes(raw[:raw.index(b'"plain_text":') + 20])
+
+    header, = storage.load_note_headers()
+    assert header.title == "Title"
+    assert header.preview == note.plain_text[:len(header.preview)]
+    assert len(header.preview) < 250
+
+
+def test_files_without_preview_are_parsed_in_full(storage, tmp_path):
+    # Written before previews and plain text were stored
+    data = {
+        "id": "legacy",
+        "title": "Old note",
+        "created_at": "2024-01-01T00:00:00",
+        "modified_at": "2024-01-02T00:00:00",
+        "is_favorite": False,
+        "content": "<p>Old note</p><p>Body text</p>",
+    }
+    (tmp_path / "legacy.json").write_text(json.dumps(data))
+
+    header, = storage.load_note_headers()
+    assert header.preview == "Old note\nBody text"
+    assert storage.search_notes("body") == ["legacy"]
+
+
+def test_search_matches_title_and_text_casefolded(storage):
+    first = make_note("<h1>Straße</h1><p>Groceries</p>")
+    second = make_note("<p>Shopping</p><p>Milk and EGGS</p>")
+    for note in (first, second):
+        storage.save_note(note)
+
+    assert storage.search_notes("strasse") == [first.id]
+    assert storage.search_notes("eggs") == [second.id]
+    assert storage.search_notes("missing") == []
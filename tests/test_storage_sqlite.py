@@ -0,0 +1,164 @@
+"""Tests for the SQLite backend's edit log."""
+
+import random
+
+import pytest
+
+# Importing the core package pulls in the Qt-based writer thread
+pytest.importorskip("PyQt6.QtCore")
+
+from src.core.note import Note, html_to_plain_text  # noqa: E402
+from src.core.storage_sqlite import (  # noqa: E402
+    _MAX_OPS_PER_NOTE,
+    SQLiteStorageManager,
+    _apply_ops,
+    _diff,
+)
+
+
+@pytest.fixture
+def storage(tmp_path):
+    manager = SQLiteStorageManager(tmp_path)
+    yield manager
+    manager.close()
+
+
+def make_note(content: str) -> Note:
+    note = Note()
+    note.update_content(content)
+    return note
+
+
+def op_count(storage: SQLiteStorageManager) -> int:
+    return storage._conn.execute("SELECT COUNT(*) FROM note_ops").fetchone()[0]
+
+
+@pytest.mark.parametrize("old, new", [
+    ("", ""),
+    ("", "abc"),
+    ("abc", ""),
+    ("abc", "abc"),
+    ("abc", "abXc"),
+    ("abc", "Xabc"),
+    ("abc", "abcX"),
+    ("aaaa", "aaa"),
+    ("abcabc", "abc"),
+    ("<p>Hello</p>", "<p>Hello world</p>"),
+])
+def test_diff_is_a_single_splice(old, new):
+    start, removed, inserted = _diff(old, new)
+
+    assert old[:start] + inserted + old[start + removed:] == new
+    assert _apply_ops(old, [(start, removed, inserted)]) == new
+
+
+def test_diff_round_trips_random_edits():
+    rng = random.Random(1234)
+    text = ""
+    ops = []
+    snapshot = text
+    for _ in range(200):
+        start = rng.randint(0, len(text))
+        end = rng.randint(start, len(text))
+        new = text[:start] + "".join(
+            rng.choice("ab<>p ") for _ in range(rng.randint(0, 5))
+        ) + text[end:]
+        ops.append(_diff(text, new))
+        text = new
+
+    assert _apply_ops(snapshot, ops) == text
+
+
+def test_edits_are_logged_and_replayed(storage, tmp_path):
+    note = make_note("<p>Hello</p>")
+    storage.save_note(note)
+    for word in ("brave", "new", "world"):
+        note.update_content(note.content + f"<p>{word}</p>")
+        assert storage.save_note(note)
+
+    # One content op and one plain text op per edit
+    assert op_count(storage) == 6
+
+    reader = SQLiteStorageManager(tmp_path)
+    try:
+        loaded = reader.load_note(note.id)
+        assert loaded.content == note.content
+        assert loaded.plain_text == html_to_plain_text(note.content)
+
+        header, = reader.load_note_headers()
+        assert header.title == note.title
+        assert header.preview == "Hello\nbrave\nnew\nworld"
+        assert reader.load_all_notes()[0].content == note.content
+        # The stored plain text is stale until the log is replayed
+        assert reader.search_notes("world") == [note.id]
+        assert reader.search_notes("hello") == [note.id]
+    finally:
+        reader.close()
+
+
+def test_full_log_rewrites_the_row(storage):
+    note = make_note("<p>start</p>")
+    storage.save_note(note)
+    for i in range(_MAX_OPS_PER_NOTE):
+        note.update_content(note.content + f"<p>{i}</p>")
+        storage.save_note(note)
+
+    assert op_count(storage) < _MAX_OPS_PER_NOTE
+    assert storage.load_note(note.id).content == note.content
+
+
+def test_row_written_by_another_manager_is_not_patched(storage, tmp_path):
+    note = make_note("<p>Hello</p>")
+    storage.save_note(note)
+
+    other = SQLiteStorageManager(tmp_path)
+    try:
+        copy = other.load_note(note.id)
+        copy.update_content("<p>Totally different</p>")
+        other.save_note(copy)
+    finally:
+        other.close()
+
+    # Logging this edit against the stale base would splice it into the
+    # other manager's content; it has to be written in full instead
+    note.update_content("<p>Hello</p><p>more</p>")
+    storage.save_note(note)
+
+    loaded = storage.load_note(note.id)
+    assert loaded.content == "<p>Hello</p><p>more</p>"
+    assert storage.load_note_headers()[0].preview == "Hello\nmore"
+
+
+def test_header_preview_is_bounded(storage):
+    note = make_note("<p>Title</p><p>" + "word " * 1000 + "</p>")
+    storage.save_note(note)
+    note.update_content(note.content + "<p>tail</p>")
+    storage.save_note(note)
+
+    header, = storage.load_note_headers()
+    assert header.preview == note.plain_text[:len(header.preview)]
+    assert len(header.preview) < 250
+    assert storage.search_notes("tail") == [note.id]
+
+
+def test_search_matches_title_and_text_casefolded(storage):
+    first = make_note("<h1>Straße</h1><p>Groceries</p>")
+    second = make_note("<p>Shopping</p><p>Milk and EGGS</p>")
+    for note in (first, second):
+        storage.save_note(note)
+
+    assert storage.search_notes("strasse") == [first.id]
+    assert storage.search_notes("eggs") == [second.id]
+    assert sorted(storage.search_notes("s")) == sorted([first.id, second.id])
+    assert storage.search_notes("missing") == []
+
+
+def test_delete_removes_logged_edits(storage):
+    note = make_note("<p>one</p>")
+    storage.save_note(note)
+    note.update_content("<p>one two</p>")
+    storage.save_note(note)
+
+    assert storage.delete_note(note.id)
+    assert op_count(storage) == 0
+    assert storage.load_note(note.id) is None